@@ -0,0 +1,79 @@
+"""Tests for tier23_healthcare_presentation"""
+
+import errno
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import tier23_healthcare_presentation
+from tier23_healthcare_presentation import HealthcarePresentationCreator
+
+
+def test_chart_render_leaves_global_rcparams_alone():
+    before = dict(matplotlib.rcParams)
+    creator = HealthcarePresentationCreator()
+    creator._chart_png(creator._create_healthcare_financing_pie)
+
+    assert dict(matplotlib.rcParams) == before
+
+
+def test_india_map_outline_keeps_its_proportions():
+    creator = HealthcarePresentationCreator()
+    slide = creator.prs.slides.add_slide(creator.blank_layout)
+    creator._add_india_map(slide, 0.5, 1.0, 2.0)
+
+    outline = next(shape for shape in slide.shapes if shape.name.startswith('Freeform'))
+    path = outline._element.spPr.custGeom.pathLst[0]
+    assert (path.w, path.h) == (outline.width, outline.height)
+    # 5.5 x 6.5 map units at 0.22 in per unit
+    assert abs(outline.width.inches - 1.21) < 0.01
+    assert abs(outline.height.inches - 1.43) < 0.01
+    assert abs(path.w / path.h - 5.5 / 6.5) < 0.001
+
+
+def _build_deck():
+    creator = HealthcarePresentationCreator()
+    creator.create_slide1_opportunity()
+    creator.create_slide2_healthcare()
+    creator.create_slide3_medichain()
+    return creator
+
+
+def test_saved_deck_opens_with_python_pptx(tmp_path):
+    path = tmp_path / 'deck.pptx'
+    _build_deck().save(path)
+
+    prs = Presentation(path)
+    assert len(prs.slides) == 3
+    pictures = [shape for slide in prs.slides for shape in slide.shapes
+                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+    assert pictures and all(picture.image.blob for picture in pictures)
+
+
+class _FullDiskFile(io.FileIO):
+    """File that writes half of the first chunk and then fails"""
+
+    def write(self, data):
+        super().write(bytes(data)[:len(data) // 2])
+        raise OSError(errno.ENOSPC, 'No space left on device')
+
+
+def test_failed_save_keeps_the_old_deck_and_removes_the_temp_file(tmp_path, monkeypatch):
+    path = tmp_path / 'deck.pptx'
+    path.write_bytes(b'previous deck')
+    monkeypatch.setattr(tier23_healthcare_presentation, 'open',
+                        lambda name, mode: _FullDiskFile(name, mode), raising=False)
+
+    with pytest.raises(OSError):
+        _build_deck().save(path)
+
+    assert path.read_bytes() == b'previous deck'
+    assert not os.path.exists(f"{path}.{os.getpid()}.tmp")
+    assert [p.name for p in tmp_path.iterdir()] == ['deck.pptx']
@@ -0,0 +1,64 @@
+"""Tests for ultra_condensed_ppt_system"""
+
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+from ultra_condensed_ppt_system import UltraCondensedPPT
+
+
+def _save_with_master_fill(path, rgb):
+    ppt = UltraCondensedPPT()
+    background = ppt.prs.slide_master.background.fill
+    background.solid()
+    background.fore_color.rgb = rgb
+    ppt.save(path)
+    ppt.close()
+    with zipfile.ZipFile(path) as z:
+        return z.read('ppt/slideMasters/slideMaster1.xml')
+
+
+def test_consecutive_saves_keep_each_decks_master_edits(tmp_path):
+    first = _save_with_master_fill(tmp_path / 'a.pptx', RGBColor(0x11, 0x22, 0x33))
+    second = _save_with_master_fill(tmp_path / 'b.pptx', RGBColor(0x44, 0x55, 0x66))
+
+    assert b'112233' in first and b'445566' not in first
+    assert b'445566' in second and b'112233' not in second
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def _image_parts_after(charts):
+    ppt = UltraCondensedPPT()
+    slide = ppt.prs.slides.add_slide(ppt.blank_layout)
+    for chart_data in charts:
+        ppt._add_mini_chart(slide, chart_data, Inches(1), Inches(1), Inches(6), Inches(3))
+    pictures = [pic._element.blipFill.blip.rEmbed for pic in slide.shapes]
+    return {slide.part.related_part(rId) for rId in pictures}, len(pictures)
+
+
+def test_mini_chart_render_does_not_depend_on_the_previous_chart():
+    line = {'type': 'line', 'x': list(range(2015, 2025)), 'y': [3, 4, 6, 5, 8, 9, 12, 11, 14, 16]}
+    bar = {'type': 'bar', 'labels': ['2023', '2024', '2025', '2026'], 'values': [500, 1000, 1800, 2500]}
+
+    parts, pictures = _image_parts_after([line, bar, line])
+
+    assert pictures == 3
+    assert len(parts) == 2
+
+
+def test_identical_mini_charts_share_one_image_part(tmp_path):
+    ppt = UltraCondensedPPT()
+    chart_data = {'type': 'bar', 'labels': ['2023', '2024', '2025', '2026'], 'values': [500, 1000, 1800, 2500]}
+    for _ in range(2):
+        slide = ppt.prs.slides.add_slide(ppt.blank_layout)
+        ppt._add_mini_chart(slide, chart_data, Inches(1), Inches(1), Inches(6), Inches(3))
+    ppt.save(tmp_path / 'charts.pptx')
+
+    with zipfile.ZipFile(tmp_path / 'charts.pptx') as z:
+        media = [name for name in z.namelist() if name.startswith('ppt/media/')]
+    assert len(media) == 1
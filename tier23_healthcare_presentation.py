@@ -9,34 +9,321 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_VERTICAL_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import ChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle, Rectangle, FancyArrowPatch
-import numpy as np
+from pptx.chart.data import ChartData, XyChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION, XL_MARKER_STYLE, XL_TICK_LABEL_POSITION
+from pptx.enum.dml import MSO_LINE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.serialized import PackageWriter
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from xml.sax.saxutils import escape
+from lxml.etree import SubElement
+import copy
+import functools
+import hashlib
 import io
+import os
+import zipfile
+
+# matplotlib is imported inside the chart helpers so that importing this module
+# (or building text-only slides) does not pay for the font scan and backend setup
+
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Import pyplot once"""
+    import matplotlib.pyplot as plt
+    return plt
+
+# Chart fonts pinned to matplotlib's bundled DejaVu Sans; applied only while a chart renders
+CHART_RC = {'font.family': 'DejaVu Sans', 'font.sans-serif': ['DejaVu Sans']}
+
+# Pilot conversion funnel data: (stage, value, palette key); geometry is built once on first use
+FUNNEL_STAGES = [
+    ('Addressable Population', 650000, 'primary_blue'),
+    ('Reach (Awareness)', 75000, 'accent_teal'),
+    ('Active Users', 50000, 'success_green'),
+    ('Teleconsults', 20000, 'warning_orange'),
+    ('Paid Subscribers', 5000, 'danger_red'),
+]
+FUNNEL_MAX_WIDTH = 8
+FUNNEL_TOP_Y = 5
+
+
+@functools.lru_cache(maxsize=None)
+def _funnel_vertices():
+    """Corner array of shape (N, 4, 2): trapezoids into the next stage, rectangle for the last"""
+    import numpy as np  # only the funnel chart needs it
+
+    stages, max_width, top_y = FUNNEL_STAGES, FUNNEL_MAX_WIDTH, FUNNEL_TOP_Y
+    values = np.array([value for _, value, _ in stages], dtype=np.float32)
+    widths = max_width * values / values[0]
+    xs = (10 - widths) / 2
+    ys = top_y - np.arange(len(stages), dtype=np.float32)
+
+    next_widths = np.append(widths[1:], widths[-1])
+    next_xs = (10 - next_widths) / 2
+    return np.stack([
+        np.stack([xs, ys], axis=1),
+        np.stack([xs + widths, ys], axis=1),
+        np.stack([next_xs + next_widths, ys - 1], axis=1),
+        np.stack([next_xs, ys - 1], axis=1),
+    ], axis=1)
+
+
+# Simplified India outline and city markers: (x, y[, radius]) in map units, y up
+INDIA_OUTLINE = [
+    (3, 2), (4, 1.5), (5, 1.5), (6, 2),
+    (7, 3), (7.5, 4), (7, 5), (6.5, 6),
+    (6, 7), (5.5, 7.5), (5, 8), (4, 7.5),
+    (3, 7), (2.5, 6), (2, 5), (2, 4),
+    (2.5, 3), (3, 2)
+]
+TIER23_REGIONS = [
+    (3.5, 5, 0.4),
+    (5, 4, 0.5),
+    (4, 6, 0.4),
+    (5.5, 5.5, 0.45),
+    (3, 3.5, 0.35),
+]
+METRO_CITIES = [
+    (3, 6.5, 0.25),    # Delhi
+    (3.5, 4, 0.25),    # Mumbai
+    (5.5, 3, 0.25),    # Chennai
+    (6, 5, 0.25),      # Kolkata
+]
+
+# Competitive matrix: (name, geography focus, service breadth, palette key), 0-10 scales
+COMPETITORS = [
+    ('Practo/Tata Health', 2, 7, 'primary_blue'),
+    ('1mg/PharmEasy', 2.5, 3, 'warning_orange'),
+    ('eSanjeevani', 7, 6, 'success_green'),
+    ('MediChain\n(Opportunity)', 7.5, 8, 'danger_red'),
+]
+# Quadrant (lower-left corner, fill): light tints pre-blended onto white
+MATRIX_QUADRANTS = [
+    ((0, 5), RGBColor(253, 253, 253)),
+    ((5, 5), RGBColor(251, 253, 255)),
+    ((0, 0), RGBColor(255, 253, 251)),
+    ((5, 0), RGBColor(251, 255, 251)),
+]
+# Inner plot area as (x, y, w, h) fractions of the chart frame
+MATRIX_PLOT_LAYOUT = (0.15, 0.04, 0.8, 0.78)
+MATRIX_PLOT_LAYOUT_XML = (
+    '<c:layout %s><c:manualLayout><c:layoutTarget val="inner"/>'
+    '<c:xMode val="edge"/><c:yMode val="edge"/>'
+    '<c:x val="%s"/><c:y val="%s"/><c:w val="%s"/><c:h val="%s"/>'
+    '</c:manualLayout></c:layout>'
+) % ((nsdecls('c'),) + MATRIX_PLOT_LAYOUT)
+
+# 5-year roadmap: (fraction along the timeline, year, details, palette key)
+ROADMAP_MILESTONES = [
+    (0.2, 'Year 1', '100 kiosks\n50K users', 'accent_teal'),
+    (0.5, 'Year 3', '25 cities\n1M users', 'success_green'),
+    (0.8, 'Year 5', 'Pan-India\n100M lives', 'danger_red'),
+]
+
+EMU_PER_INCH = 914400
+
+
+def _emu_box(left, top, width, height):
+    """Convert an (x, y, w, h) box in inches to EMU ints, as Inches() would"""
+    return tuple(int(v * EMU_PER_INCH) for v in (left, top, width, height))
+
+
+# Fixed slide 3 placements as EMU (x, y, w, h) boxes
+SLIDE3_DIFF_TITLE = _emu_box(0.5, 2.6, 5, 0.4)
+SLIDE3_DIFF_POINT = _emu_box(0.6, 3.0, 5, 0.35)
+SLIDE3_DIFF_POINT_STEP = int(0.4 * EMU_PER_INCH)
+SLIDE3_IMPACT_TITLE = _emu_box(0.5, 4.5, 5, 0.4)
+SLIDE3_IMPACT_BOX = _emu_box(0.5, 4.95, 5.5, 1.8)
+SLIDE3_IMPACT_TEXT = _emu_box(0.7, 5.05, 5.2, 1.6)
+SLIDE3_FUNNEL = _emu_box(6.2, 2.6, 3.5, 4)
+
+# Presenters' footer on the shared layout
+FOOTER_BOX = _emu_box(0.5, 7.15, 12.3, 0.3)
+
+# The XML templates below are kept free of whitespace between tags: that is the form
+# python-pptx serializes, and the parser has no ignorable text nodes to skip
+
+# Centered single-run paragraph, formatted through pPr/defRPr as the Font setters write it
+PARAGRAPH_TEMPLATE = (
+    '<a:p ' + nsdecls('a') + '><a:pPr algn="ctr"><a:defRPr sz="{size}"{bold}{italic}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill><a:latin typeface="{font}"/>'
+    '</a:defRPr></a:pPr><a:r><a:t>{text}</a:t></a:r></a:p>'
+)
+
+# Impact-box header paragraph; {spacing} is an optional <a:spcBef>
+HEADER_P_XML = (
+    '<a:p ' + nsdecls('a') + '><a:pPr>{spacing}<a:defRPr sz="1100" b="1"><a:solidFill>'
+    '<a:srgbClr val="{color}"/></a:solidFill><a:latin typeface="Segoe UI Semibold"/></a:defRPr>'
+    '</a:pPr><a:r><a:t>{text}</a:t></a:r></a:p>'
+)
+# Paragraph with its space-before baked in; {attrs} holds extra pPr attributes and
+# {bullet} an optional <a:buChar>
+SPACED_P_XML = (
+    '<a:p ' + nsdecls('a') + '><a:pPr{attrs}><a:spcBef><a:spcPts val="{spacing}"/></a:spcBef>{bullet}'
+    '<a:defRPr sz="{size}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:latin typeface="{font}"/></a:defRPr></a:pPr><a:r><a:t>{text}</a:t></a:r></a:p>'
+)
+# Splits the current run at a newline, as the paragraph text setter does
+LINE_BREAK_XML = '</a:t></a:r><a:br/><a:r><a:t>'
+# Native bullet with a 0.25" hanging indent
+BULLET_ATTRS = ' marL="228600" indent="-228600"'
+BULLET_CHAR_XML = '<a:buChar char="•"/>'
+
+
+
+def _spaced_p_xml(text, font_name, size, color, spacing, centered=False, bullet=False):
+    """SPACED_P_XML for text (newlines become line breaks); size and spacing in points"""
+    return SPACED_P_XML.format(
+        attrs=(BULLET_ATTRS if bullet else '') + (' algn="ctr"' if centered else ''),
+        bullet=BULLET_CHAR_XML if bullet else '',
+        spacing=spacing * 100,
+        size=size * 100,
+        color=color,
+        font=escape(font_name),
+        text=escape(text).replace('\n', LINE_BREAK_XML),
+    )
+
+
+# Detached container for parsing a batch of <a:p> fragments in one call
+P_BATCH_OPEN = '<a:txBody ' + nsdecls('a') + '>'
+P_BATCH_CLOSE = '</a:txBody>'
+
+# Slide 3 impact box bullets
+IMPACT_ECONOMIC_POINTS = (
+    "Low OOP burden for families",
+    "Scalable subscription revenue",
+    "Job creation in rural areas",
+)
+IMPACT_SOCIAL_POINTS = (
+    "Access for 100M+ underserved",
+    "Preventive care culture",
+    "SDG-3 alignment",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _impact_paragraphs_xml(navy_hex, gray_hex):
+    """Batched <a:p> XML for the impact box headers and bullets, built once per color pair"""
+    body_xml = io.StringIO()
+    body_xml.write(P_BATCH_OPEN)
+    body_xml.write(HEADER_P_XML.format(spacing='', color=navy_hex, text="Economic Impact:"))
+    body_xml.writelines(
+        _spaced_p_xml(point, 'Segoe UI', 10, gray_hex, 1, bullet=True) for point in IMPACT_ECONOMIC_POINTS
+    )
+    body_xml.write(HEADER_P_XML.format(
+        spacing='<a:spcBef><a:spcPts val="800"/></a:spcBef>', color=navy_hex, text="Social Impact:"
+    ))
+    body_xml.writelines(
+        _spaced_p_xml(point, 'Segoe UI', 10, gray_hex, 1, bullet=True) for point in IMPACT_SOCIAL_POINTS
+    )
+    body_xml.write(P_BATCH_CLOSE)
+    return body_xml.getvalue()
+
+# Clark-notation tag names for the fill and outline nodes _add_box writes
+QN_SOLID_FILL = qn('a:solidFill')
+QN_SRGB_CLR = qn('a:srgbClr')
+QN_LN = qn('a:ln')
+QN_NO_FILL = qn('a:noFill')
+
+# Part extensions that are already compressed and are stored rather than deflated
+STORED_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif')
+
+
+class _ZipPartWriter:
+    """Writes package parts into an open ZipFile, deflating XML at a fast level"""
+
+    def __init__(self, zipf):
+        self._zipf = zipf
+
+    def write(self, pack_uri, blob):
+        if pack_uri.ext.lower() in STORED_EXTENSIONS:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
+
+# Overrides python-pptx internals (_write and its _write_* steps; save() passes package._rels),
+# which have no public equivalent, so the README pins python-pptx to 1.0.2
+class FastPackageWriter(PackageWriter):
+    """PackageWriter using deflate level 1 for XML parts and no deflate for images"""
+
+    def _write(self):
+        with zipfile.ZipFile(self._pkg_file, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=1, strict_timestamps=False) as zipf:
+            phys_writer = _ZipPartWriter(zipf)
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
 
 class HealthcarePresentationCreator:
+    # Per-instance state only; the palettes below are class attributes
+    __slots__ = ('prs', 'blank_layout', '_image_parts', '_shape_templates', '_chart_cache')
+
+    # Professional color palette (shared by all instances)
+    colors = {
+        'primary_blue': RGBColor(0, 102, 204),      # Professional blue
+        'accent_teal': RGBColor(0, 153, 153),       # Teal accent
+        'dark_navy': RGBColor(25, 42, 86),          # Dark navy
+        'success_green': RGBColor(76, 175, 80),     # Success green
+        'warning_orange': RGBColor(255, 152, 0),    # Warning orange
+        'danger_red': RGBColor(244, 67, 54),        # Danger red
+        'dark_gray': RGBColor(66, 66, 66),          # Dark gray text
+        'medium_gray': RGBColor(117, 117, 117),     # Medium gray
+        'light_gray': RGBColor(189, 189, 189),      # Light gray
+        'very_light_gray': RGBColor(245, 245, 245), # Background gray
+        'white': RGBColor(255, 255, 255),           # White
+    }
+
+    # Same palette as 0-1 float tuples for matplotlib
+    mpl_colors = {name: tuple(c / 255 for c in rgb) for name, rgb in colors.items()}
+
+    # And as the hex strings written into srgbClr val attributes
+    hex_colors = {name: '%02X%02X%02X' % tuple(rgb) for name, rgb in colors.items()}
+
     def __init__(self):
         self.prs = Presentation()
         self.prs.slide_width = Inches(13.333)  # 16:9 widescreen
         self.prs.slide_height = Inches(7.5)
 
-        # Professional color palette
-        self.colors = {
-            'primary_blue': RGBColor(0, 102, 204),      # Professional blue
-            'accent_teal': RGBColor(0, 153, 153),       # Teal accent
-            'dark_navy': RGBColor(25, 42, 86),          # Dark navy
-            'success_green': RGBColor(76, 175, 80),     # Success green
-            'warning_orange': RGBColor(255, 152, 0),    # Warning orange
-            'danger_red': RGBColor(244, 67, 54),        # Danger red
-            'dark_gray': RGBColor(66, 66, 66),          # Dark gray text
-            'medium_gray': RGBColor(117, 117, 117),     # Medium gray
-            'light_gray': RGBColor(189, 189, 189),      # Light gray
-            'very_light_gray': RGBColor(245, 245, 245), # Background gray
-            'white': RGBColor(255, 255, 255),           # White
-        }
+        # Image parts already in the package, keyed by SHA256 of the PNG bytes
+        self._image_parts = {}
+
+        # Detached <p:sp> elements keyed by (preset, fill, line, line width)
+        self._shape_templates = {}
+
+        # Rendered chart PNG bytes keyed by helper name
+        self._chart_cache = {}
+
+        # Blank layout shared by every slide, carrying the static footer
+        self.blank_layout = self.prs.slide_layouts[6]
+        self._add_layout_footer(self.blank_layout)
+
+    def _set_paragraph(self, tf, text, font_name, size, color, bold=False, italic=False):
+        """Replace the first paragraph of tf with a centered one in a single parse; color is a hex string"""
+        p = parse_xml(PARAGRAPH_TEMPLATE.format(
+            size=size * 100,
+            bold=' b="1"' if bold else '',
+            italic=' i="1"' if italic else '',
+            color=color,
+            font=escape(font_name),
+            text=escape(text),
+        ))
+        txBody = tf._txBody
+        txBody.replace(txBody.p_lst[0], p)
+
+    def _apply_font(self, p, font_name, size, color, bold=False):
+        """Set the paragraph font; bold is only written when requested"""
+        font = p.font
+        font.name = font_name
+        font.size = size
+        if bold:
+            font.bold = True
+        font.color.rgb = color
 
     def _add_title(self, slide, main_title, subtitle=None):
         """Add title with optional subtitle"""
@@ -46,17 +333,10 @@ class HealthcarePresentationCreator:
             Inches(12.3), Inches(0.6)
         )
         tf = title_box.text_frame
-        tf.clear()
         tf.margin_left = tf.margin_right = Inches(0.1)
         tf.margin_top = tf.margin_bottom = Inches(0.05)
 
-        p = tf.paragraphs[0]
-        p.text = main_title
-        p.font.name = 'Segoe UI'
-        p.font.size = Pt(28)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark_navy']
-        p.alignment = PP_ALIGN.CENTER
+        self._set_paragraph(tf, main_title, 'Segoe UI', 28, self.hex_colors['dark_navy'], bold=True)
 
         if subtitle:
             subtitle_box = slide.shapes.add_textbox(
@@ -64,48 +344,29 @@ class HealthcarePresentationCreator:
                 Inches(12.3), Inches(0.8)
             )
             tf = subtitle_box.text_frame
-            tf.clear()
             tf.margin_all = Inches(0.1)
             tf.word_wrap = True
 
-            p = tf.paragraphs[0]
-            p.text = subtitle
-            p.font.name = 'Segoe UI'
-            p.font.size = Pt(14)
-            p.font.color.rgb = self.colors['medium_gray']
-            p.alignment = PP_ALIGN.CENTER
-            p.font.italic = True
-
-    def _add_footer(self, slide, slide_number):
-        """Add footer with presenters' names"""
-        footer_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(7.15),
-            Inches(12.3), Inches(0.3)
+            self._set_paragraph(tf, subtitle, 'Segoe UI', 14, self.hex_colors['medium_gray'], italic=True)
+
+    def _add_layout_footer(self, layout):
+        """Put the presenters' names on the layout once, so every slide built from it shows them"""
+        shapes = layout.shapes
+        sp = CT_Shape.new_textbox_sp(shapes._next_shape_id, 'Footer', *FOOTER_BOX)
+        shapes._spTree.insert_element_before(sp, 'p:extLst')
+        self._set_paragraph(
+            shapes[-1].text_frame,
+            "Presented By — Nakul Nandanwar, Vaishnavi Bhangale, Rahul Kumbhare",
+            'Segoe UI', 10, self.hex_colors['medium_gray']
         )
-        tf = footer_box.text_frame
-        tf.clear()
-
-        p = tf.paragraphs[0]
-        p.text = "Presented By — Nakul Nandanwar, Vaishnavi Bhangale, Rahul Kumbhare"
-        p.font.name = 'Segoe UI'
-        p.font.size = Pt(10)
-        p.font.color.rgb = self.colors['medium_gray']
-        p.alignment = PP_ALIGN.CENTER
 
-        # Slide number
+    def _add_footer(self, slide, slide_number):
+        """Add the slide number; the presenters' names come from the layout"""
         num_box = slide.shapes.add_textbox(
             Inches(12.5), Inches(7.15),
             Inches(0.3), Inches(0.3)
         )
-        tf = num_box.text_frame
-        tf.clear()
-
-        p = tf.paragraphs[0]
-        p.text = str(slide_number)
-        p.font.name = 'Segoe UI'
-        p.font.size = Pt(10)
-        p.font.color.rgb = self.colors['medium_gray']
-        p.alignment = PP_ALIGN.CENTER
+        self._set_paragraph(num_box.text_frame, str(slide_number), 'Segoe UI', 10, self.hex_colors['medium_gray'])
 
     def _add_bottom_banner(self, slide, text):
         """Add bottom insight banner"""
@@ -119,100 +380,139 @@ class HealthcarePresentationCreator:
         banner.line.fill.background()
 
         tf = banner.text_frame
-        tf.clear()
         tf.margin_all = Inches(0.02)
 
-        p = tf.paragraphs[0]
-        p.text = text
+        self._set_paragraph(tf, text, 'Segoe UI', 11, self.hex_colors['white'], bold=True)
+        tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+
+    def _add_box(self, slide, preset, left, top, width, height, fill, line=None, line_width=None):
+        """Add a filled shape, cloning a cached template when this style was built before"""
+        key = (preset, str(fill), str(line), line_width)
+        template = self._shape_templates.get(key)
+        if template is None:
+            shape = slide.shapes.add_shape(preset, left, top, width, height)
+            # Append <a:solidFill> and <a:ln> after prstGeom directly rather than through the
+            # fill/line proxies, which search for each node before creating it
+            spPr = shape._element.spPr
+            SubElement(SubElement(spPr, QN_SOLID_FILL), QN_SRGB_CLR, val=str(fill))
+            if line is None:
+                SubElement(SubElement(spPr, QN_LN), QN_NO_FILL)
+            else:
+                ln = SubElement(spPr, QN_LN)
+                if line_width is not None:  # otherwise keep the theme width, as the line proxy did
+                    ln.set('w', str(line_width))
+                SubElement(SubElement(ln, QN_SOLID_FILL), QN_SRGB_CLR, val=str(line))
+            self._shape_templates[key] = copy.deepcopy(shape._element)
+            return shape
+
+        sp = copy.deepcopy(template)
+        shape_id = slide.shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"{sp.nvSpPr.cNvPr.name.rsplit(' ', 1)[0]} {shape_id - 1}"
+        sp.x, sp.y, sp.cx, sp.cy = left, top, width, height
+        slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+        return slide.shapes._shape_factory(sp)
+
+    def _chart_png(self, create_chart):
+        """Return a PNG buffer for a chart helper, rendering it only on first use"""
+        # Rendered serially: a process pool would re-import matplotlib in every worker,
+        # which costs more than the three small charts take to draw
+        key = create_chart.__name__
+        if key not in self._chart_cache:
+            # CHART_RC is scoped to the render, so other matplotlib users keep their fonts
+            with _pyplot().rc_context(CHART_RC):
+                self._chart_cache[key] = create_chart().getvalue()
+        return io.BytesIO(self._chart_cache[key])
+
+    def _add_chart_image(self, slide, image_buf, left, top, width, height):
+        """Place a rendered chart, sharing one image part per distinct PNG"""
+        blob = image_buf.getvalue()
+        digest = hashlib.sha256(blob).hexdigest()
+        image_part = self._image_parts.get(digest)
+        if image_part is None:
+            image_part = self.prs.part.package.get_or_add_image_part(io.BytesIO(blob))
+            self._image_parts[digest] = image_part
+
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+        slide.shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+
+    def _add_india_map(self, slide, left, top, width):
+        """Draw the India map highlighting Tier-2/3 cities as native shapes (dimensions in inches)"""
+        title_box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(0.3))
+        p = title_box.text_frame.paragraphs[0]
+        p.text = "India: Tier-2/3 Market Distribution"
         p.font.name = 'Segoe UI'
         p.font.size = Pt(11)
         p.font.bold = True
-        p.font.color.rgb = self.colors['white']
+        p.font.color.rgb = self.colors['dark_navy']
         p.alignment = PP_ALIGN.CENTER
-        tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-
-    def _create_india_map_visual(self):
-        """Create India map highlighting Tier-2/3 cities"""
-        fig, ax = plt.subplots(figsize=(6, 5), dpi=150)
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 10)
-        ax.axis('off')
 
-        # Simplified India outline
-        india_outline = plt.Polygon([
-            (3, 2), (4, 1.5), (5, 1.5), (6, 2),
-            (7, 3), (7.5, 4), (7, 5), (6.5, 6),
-            (6, 7), (5.5, 7.5), (5, 8), (4, 7.5),
-            (3, 7), (2.5, 6), (2, 5), (2, 4),
-            (2.5, 3), (3, 2)
-        ], facecolor='#f0f0f0', edgecolor='#333333', linewidth=2)
-        ax.add_patch(india_outline)
-
-        # Convert RGBColor to tuple for matplotlib
-        teal_color = (0/255, 153/255, 153/255)
-        blue_color = (0/255, 102/255, 204/255)
-
-        # Highlight Tier-2/3 regions
-        tier23_regions = [
-            Circle((3.5, 5), 0.4, color=teal_color, alpha=0.6),
-            Circle((5, 4), 0.5, color=teal_color, alpha=0.6),
-            Circle((4, 6), 0.4, color=teal_color, alpha=0.6),
-            Circle((5.5, 5.5), 0.45, color=teal_color, alpha=0.6),
-            Circle((3, 3.5), 0.35, color=teal_color, alpha=0.6),
-        ]
-
-        for region in tier23_regions:
-            ax.add_patch(region)
-
-        # Metro cities (smaller, different color)
-        metros = [
-            Circle((3, 6.5), 0.25, color=blue_color, alpha=0.8),  # Delhi
-            Circle((3.5, 4), 0.25, color=blue_color, alpha=0.8),  # Mumbai
-            Circle((5.5, 3), 0.25, color=blue_color, alpha=0.8),  # Chennai
-            Circle((6, 5), 0.25, color=blue_color, alpha=0.8),    # Kolkata
-        ]
-
-        for metro in metros:
-            ax.add_patch(metro)
+        # Map units (x 2..7.5, y 8..1.5) are drawn at a uniform scale below the title
+        scale = 0.22
+        origin_x = left + 0.3
+        origin_y = top + 0.35
+
+        # Vertices are converted to EMU up front: build_freeform rounds them to whole local units,
+        # which would snap the half-unit map points to an integer grid
+        unit = Inches(scale)
+        points = [(int((x - 2) * unit), int((8 - y) * unit)) for x, y in INDIA_OUTLINE]
+        outline = slide.shapes.build_freeform(*points[0], scale=1.0)
+        outline.add_line_segments(points[1:])
+        outline = outline.convert_to_shape(Inches(origin_x), Inches(origin_y))
+        outline.fill.solid()
+        outline.fill.fore_color.rgb = RGBColor(240, 240, 240)
+        outline.line.color.rgb = RGBColor(51, 51, 51)
+        outline.line.width = Pt(1.5)
+
+        for markers, color in ((TIER23_REGIONS, self.colors['accent_teal']),
+                               (METRO_CITIES, self.colors['primary_blue'])):
+            for x, y, radius in markers:
+                dot = slide.shapes.add_shape(
+                    MSO_SHAPE.OVAL,
+                    Inches(origin_x + (x - 2 - radius) * scale),
+                    Inches(origin_y + (8 - y - radius) * scale),
+                    Inches(2 * radius * scale), Inches(2 * radius * scale)
+                )
+                dot.fill.solid()
+                dot.fill.fore_color.rgb = color
+                dot.line.fill.background()
 
         # Legend
-        ax.text(1, 9, "● Metro Cities", fontsize=10, color=blue_color)
-        ax.text(1, 8.5, "● Tier-2/3 Cities", fontsize=10, color=teal_color)
-
-        plt.title("India: Tier-2/3 Market Distribution", fontsize=14, fontweight='bold', pad=20)
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
-        buf.seek(0)
-        return buf
+        legend_box = slide.shapes.add_textbox(
+            Inches(left + 1.7), Inches(top + 0.5), Inches(width - 1.7), Inches(0.5)
+        )
+        tf = legend_box.text_frame
+        for i, (label, color) in enumerate((("● Metro Cities", self.colors['primary_blue']),
+                                            ("● Tier-2/3 Cities", self.colors['accent_teal']))):
+            p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+            p.text = label
+            p.font.name = 'Segoe UI'
+            p.font.size = Pt(9)
+            p.font.color.rgb = color
 
     def _create_infrastructure_comparison_chart(self):
         """Create comparison chart for urban vs Tier-2/3"""
+        plt = _pyplot()
+
         fig, ax = plt.subplots(figsize=(7, 4), dpi=150)
 
         categories = ['Doctors\nper 1,000', 'Bank branches\nper 100k', 'Internet\npenetration (%)', 'Smartphone\npenetration (%)']
         urban_values = [1.8, 18, 78, 85]
         tier23_values = [0.5, 6, 62, 60]
 
-        x = np.arange(len(categories))
+        x = range(len(categories))
         width = 0.35
+        x_left = [i - width/2 for i in x]
+        x_right = [i + width/2 for i in x]
 
-        bars1 = ax.bar(x - width/2, urban_values, width, label='Urban',
-                      color=(0/255, 102/255, 204/255))
-        bars2 = ax.bar(x + width/2, tier23_values, width, label='Tier-2/3',
-                      color=(0/255, 153/255, 153/255))
+        bars1 = ax.bar(x_left, urban_values, width, label='Urban',
+                      color=self.mpl_colors['primary_blue'])
+        bars2 = ax.bar(x_right, tier23_values, width, label='Tier-2/3',
+                      color=self.mpl_colors['accent_teal'])
 
         # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{height}', ha='center', va='bottom', fontsize=10)
-
-        for bar in bars2:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{height}', ha='center', va='bottom', fontsize=10)
+        ax.bar_label(bars1, padding=3, fontsize=10)
+        ax.bar_label(bars2, padding=3, fontsize=10)
 
         ax.set_ylabel('Value', fontsize=12)
         ax.set_title('Urban vs Tier-2/3 Infrastructure Gap', fontsize=14, fontweight='bold', pad=20)
@@ -222,22 +522,24 @@ class HealthcarePresentationCreator:
         ax.set_ylim(0, max(max(urban_values), max(tier23_values)) * 1.15)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-        plt.tight_layout()
+        fig.subplots_adjust(left=0.09, right=0.98, top=0.87, bottom=0.17)
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        fig.savefig(buf, format='png', facecolor='white', edgecolor='none')
+        plt.close(fig)
         buf.seek(0)
         return buf
 
     def _create_healthcare_financing_pie(self):
         """Create healthcare financing pie chart"""
+        plt = _pyplot()
+
         fig, ax = plt.subplots(figsize=(5, 4), dpi=150)
 
         sizes = [62, 30, 8]
         labels = ['Out of Pocket\n(62%)', 'Government\n(30%)', 'Insurance\n(8%)']
-        colors = [(244/255, 67/255, 54/255),
-                 (0/255, 102/255, 204/255),
-                 (76/255, 175/255, 80/255)]
+        colors = [self.mpl_colors['danger_red'],
+                 self.mpl_colors['primary_blue'],
+                 self.mpl_colors['success_green']]
 
         wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors,
                                           autopct='', startangle=90,
@@ -250,114 +552,140 @@ class HealthcarePresentationCreator:
 
         ax.set_title('Healthcare Financing Split in India', fontsize=13, fontweight='bold', pad=20)
 
-        plt.tight_layout()
+        fig.subplots_adjust(left=0.24, right=0.76, top=0.86, bottom=0.04)
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        fig.savefig(buf, format='png', facecolor='white', edgecolor='none')
+        plt.close(fig)
         buf.seek(0)
         return buf
 
-    def _create_competitive_matrix(self):
-        """Create 2x2 competitive positioning matrix"""
-        fig, ax = plt.subplots(figsize=(6, 5), dpi=150)
+    def _add_competitive_matrix(self, slide, left, top, width, height):
+        """Add the 2x2 competitive positioning matrix as a native XY chart (dimensions in inches)"""
+        title_box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(0.35))
+        p = title_box.text_frame.paragraphs[0]
+        p.text = "Competitive Landscape: Healthcare Platforms"
+        p.font.name = 'Segoe UI'
+        p.font.size = Pt(13)
+        p.font.bold = True
+        p.font.color.rgb = self.colors['dark_navy']
+        p.alignment = PP_ALIGN.CENTER
 
-        # Set up the axes
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 10)
-        ax.set_xlabel('Geography Focus →\n(Urban to Rural)', fontsize=11)
-        ax.set_ylabel('Service Breadth →\n(Narrow to Broad)', fontsize=11)
-
-        # Add grid lines at midpoint
-        ax.axhline(y=5, color='gray', linestyle='--', alpha=0.5)
-        ax.axvline(x=5, color='gray', linestyle='--', alpha=0.5)
-
-        # Quadrant labels (subtle background)
-        quadrants = [
-            Rectangle((0, 5), 5, 5, facecolor='#f8f8f8', alpha=0.3),
-            Rectangle((5, 5), 5, 5, facecolor='#f0f8ff', alpha=0.3),
-            Rectangle((0, 0), 5, 5, facecolor='#fff8f0', alpha=0.3),
-            Rectangle((5, 0), 5, 5, facecolor='#f0fff0', alpha=0.3),
+        # Plot area is pinned (fractions of the chart frame) so backgrounds line up with it
+        chart_top = top + 0.35
+        chart_height = height - 0.35
+        plot_left = left + MATRIX_PLOT_LAYOUT[0] * width
+        plot_top = chart_top + MATRIX_PLOT_LAYOUT[1] * chart_height
+        plot_width = MATRIX_PLOT_LAYOUT[2] * width
+        plot_height = MATRIX_PLOT_LAYOUT[3] * chart_height
+
+        def to_slide(x, y):
+            return plot_left + x / 10 * plot_width, plot_top + (10 - y) / 10 * plot_height
+
+        # Subtle quadrant backgrounds
+        for (x, y), fill in MATRIX_QUADRANTS:
+            qx, qy = to_slide(x, y + 5)
+            quadrant = slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(qx), Inches(qy), Inches(plot_width / 2), Inches(plot_height / 2)
+            )
+            quadrant.fill.solid()
+            quadrant.fill.fore_color.rgb = fill
+            quadrant.line.fill.background()
+
+        # Highlight the opportunity gap
+        name, x, y, color_key = COMPETITORS[-1]
+        cx, cy = to_slide(x, y)
+        highlight = slide.shapes.add_shape(
+            MSO_SHAPE.OVAL,
+            Inches(cx - 0.05 * plot_width), Inches(cy - 0.05 * plot_height),
+            Inches(0.1 * plot_width), Inches(0.1 * plot_height)
+        )
+        highlight.fill.solid()
+        highlight.fill.fore_color.rgb = RGBColor(252, 198, 194)
+        highlight.line.fill.background()
+
+        chart_data = XyChartData()
+        series = chart_data.add_series('Competitors')
+        for _, x, y, _ in COMPETITORS:
+            series.add_data_point(x, y)
+
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.XY_SCATTER,
+            Inches(left), Inches(chart_top), Inches(width), Inches(chart_height),
+            chart_data
+        ).chart
+        chart.has_legend = False
+        chart.font.name = 'Segoe UI'
+        chart.font.size = Pt(9)
+        plot_area = chart._chartSpace.chart.plotArea
+        plot_area.insert(0, parse_xml(MATRIX_PLOT_LAYOUT_XML))
+
+        for axis, title in ((chart.category_axis, "Geography Focus → (Urban to Rural)"),
+                            (chart.value_axis, "Service Breadth → (Narrow to Broad)")):
+            axis.minimum_scale = 0
+            axis.maximum_scale = 10
+            axis.major_unit = 5
+            axis.has_major_gridlines = True
+            axis.major_gridlines.format.line.color.rgb = self.colors['light_gray']
+            axis.major_gridlines.format.line.dash_style = MSO_LINE.DASH
+            axis.tick_label_position = XL_TICK_LABEL_POSITION.NONE
+            axis.has_title = True
+            axis.axis_title.text_frame.text = title
+            axis.axis_title.text_frame.paragraphs[0].font.size = Pt(10)
+            axis.axis_title.text_frame.paragraphs[0].font.bold = False
+
+        plot = chart.plots[0]
+        for point, (name, _, _, color_key) in zip(plot.series[0].points, COMPETITORS):
+            is_opportunity = 'MediChain' in name
+            point.marker.style = XL_MARKER_STYLE.STAR if is_opportunity else XL_MARKER_STYLE.CIRCLE
+            point.marker.size = 14 if is_opportunity else 11
+            point.marker.format.fill.solid()
+            point.marker.format.fill.fore_color.rgb = self.colors[color_key]
+            point.marker.format.line.color.rgb = RGBColor(0, 0, 0)
+            point.data_label.text_frame.text = name
+            point.data_label.text_frame.paragraphs[0].font.bold = True
+            point.data_label.position = XL_LABEL_POSITION.RIGHT
+
+        # Axis end labels (value axes can't carry text tick labels)
+        plot_right = plot_left + plot_width
+        plot_bottom = plot_top + plot_height
+        axis_labels = [
+            ("Urban", plot_left, plot_bottom, PP_ALIGN.LEFT),
+            ("Rural", plot_right - 0.8, plot_bottom, PP_ALIGN.RIGHT),
+            ("Broad", plot_left - 0.85, plot_top - 0.1, PP_ALIGN.RIGHT),
+            ("Narrow", plot_left - 0.85, plot_bottom - 0.2, PP_ALIGN.RIGHT),
         ]
-        for q in quadrants:
-            ax.add_patch(q)
-
-        # Plot competitors
-        competitors = {
-            'Practo/Tata Health': (2, 7, (0/255, 102/255, 204/255)),
-            '1mg/PharmEasy': (2.5, 3, (255/255, 152/255, 0/255)),
-            'eSanjeevani': (7, 6, (76/255, 175/255, 80/255)),
-            'MediChain\n(Opportunity)': (7.5, 8, (244/255, 67/255, 54/255)),
-        }
-
-        for name, (x, y, color) in competitors.items():
-            if 'MediChain' in name:
-                # Highlight opportunity gap
-                circle = Circle((x, y), 0.5, color=color, alpha=0.3)
-                ax.add_patch(circle)
-                ax.scatter(x, y, s=200, c=[color], marker='*', edgecolors='black', linewidth=2)
-            else:
-                ax.scatter(x, y, s=150, c=[color], alpha=0.8, edgecolors='black', linewidth=1)
-
-            ax.annotate(name, (x, y), xytext=(5, 5), textcoords='offset points',
-                       fontsize=9, fontweight='bold')
-
-        ax.set_title('Competitive Landscape: Healthcare Platforms', fontsize=13, fontweight='bold', pad=20)
-        ax.set_xticks([0, 2.5, 5, 7.5, 10])
-        ax.set_xticklabels(['Urban', '', 'Mixed', '', 'Rural'], fontsize=9)
-        ax.set_yticks([0, 2.5, 5, 7.5, 10])
-        ax.set_yticklabels(['Narrow', '', 'Medium', '', 'Broad'], fontsize=9)
-
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
-        buf.seek(0)
-        return buf
+        for text, x, y, align in axis_labels:
+            label_box = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(0.8), Inches(0.25))
+            p = label_box.text_frame.paragraphs[0]
+            p.text = text
+            p.font.name = 'Segoe UI'
+            p.font.size = Pt(9)
+            p.font.color.rgb = self.colors['medium_gray']
+            p.alignment = align
 
     def _create_conversion_funnel(self):
         """Create conversion funnel diagram"""
-        fig, ax = plt.subplots(figsize=(5, 6), dpi=150)
+        plt = _pyplot()
+        from matplotlib.collections import PolyCollection
 
-        # Funnel data
-        stages = [
-            ('Addressable Population', 650000, (0/255, 102/255, 204/255)),
-            ('Reach (Awareness)', 75000, (0/255, 153/255, 153/255)),
-            ('Active Users', 50000, (76/255, 175/255, 80/255)),
-            ('Teleconsults', 20000, (255/255, 152/255, 0/255)),
-            ('Paid Subscribers', 5000, (244/255, 67/255, 54/255)),
-        ]
+        fig, ax = plt.subplots(figsize=(5, 6), dpi=150)
 
-        y_pos = 5
-        max_width = 8
-
-        for i, (stage, value, color) in enumerate(stages):
-            width = max_width * (value / stages[0][1])
-            x_pos = (10 - width) / 2
-
-            # Draw trapezoid/rectangle
-            if i < len(stages) - 1:
-                next_width = max_width * (stages[i+1][1] / stages[0][1])
-                next_x = (10 - next_width) / 2
-
-                trapezoid = plt.Polygon([
-                    (x_pos, y_pos),
-                    (x_pos + width, y_pos),
-                    (next_x + next_width, y_pos - 1),
-                    (next_x, y_pos - 1)
-                ], facecolor=color, alpha=0.7, edgecolor='black', linewidth=1)
-                ax.add_patch(trapezoid)
-            else:
-                rect = Rectangle((x_pos, y_pos - 1), width, 1,
-                               facecolor=color, alpha=0.7, edgecolor='black', linewidth=1)
-                ax.add_patch(rect)
+        # Draw all trapezoids in one batch
+        ax.add_collection(PolyCollection(
+            _funnel_vertices(), facecolors=[self.mpl_colors[key] for _, _, key in FUNNEL_STAGES],
+            alpha=0.7, edgecolors='black', linewidths=1
+        ))
 
+        y_pos = FUNNEL_TOP_Y
+        for i, (stage, value, _) in enumerate(FUNNEL_STAGES):
             # Add text
             ax.text(5, y_pos - 0.5, f"{stage}\n{value:,}",
                    ha='center', va='center', fontsize=10, fontweight='bold', color='white')
 
             # Conversion rate
             if i > 0:
-                conv_rate = (value / stages[i-1][1]) * 100
+                conv_rate = (value / FUNNEL_STAGES[i-1][1]) * 100
                 ax.text(9.5, y_pos + 0.25, f"{conv_rate:.0f}%",
                        ha='right', va='center', fontsize=9, color='gray')
 
@@ -368,57 +696,75 @@ class HealthcarePresentationCreator:
         ax.axis('off')
         ax.set_title('Pilot Conversion Funnel', fontsize=13, fontweight='bold', pad=20)
 
-        plt.tight_layout()
+        fig.subplots_adjust(left=0.02, right=0.98, top=0.92, bottom=0.02)
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        fig.savefig(buf, format='png', facecolor='white', edgecolor='none')
+        plt.close(fig)
         buf.seek(0)
         return buf
 
-    def _create_roadmap_visual(self):
-        """Create 5-year roadmap arrows"""
-        fig, ax = plt.subplots(figsize=(10, 3), dpi=150)
-
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 3)
-        ax.axis('off')
+    def _add_roadmap(self, slide, left, top, width, height):
+        """Draw the 5-year roadmap timeline as native shapes (dimensions in inches)"""
+        title_box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(0.35))
+        p = title_box.text_frame.paragraphs[0]
+        p.text = "5-Year Scale Roadmap"
+        p.font.name = 'Segoe UI'
+        p.font.size = Pt(13)
+        p.font.bold = True
+        p.font.color.rgb = self.colors['dark_navy']
+        p.alignment = PP_ALIGN.CENTER
 
         # Timeline arrow
-        arrow = FancyArrowPatch((0.5, 1.5), (9.5, 1.5),
-                               arrowstyle='->', mutation_scale=20,
-                               linewidth=2, color=(0/255, 102/255, 204/255))
-        ax.add_patch(arrow)
+        line_y = top + height / 2
+        arrow = slide.shapes.add_shape(
+            MSO_SHAPE.RIGHT_ARROW,
+            Inches(left + 0.1), Inches(line_y - 0.08), Inches(width - 0.2), Inches(0.16)
+        )
+        arrow.fill.solid()
+        arrow.fill.fore_color.rgb = self.colors['primary_blue']
+        arrow.line.fill.background()
 
         # Milestones
-        milestones = [
-            (2, 'Year 1', '100 kiosks\n50K users', (0/255, 153/255, 153/255)),
-            (5, 'Year 3', '25 cities\n1M users', (76/255, 175/255, 80/255)),
-            (8, 'Year 5', 'Pan-India\n100M lives', (244/255, 67/255, 54/255)),
-        ]
+        label_width = 1.0
+        for fraction, year, details, color_key in ROADMAP_MILESTONES:
+            x = left + fraction * width
 
-        for x, year, details, color in milestones:
-            # Milestone circle
-            circle = Circle((x, 1.5), 0.2, color=color, zorder=3)
-            ax.add_patch(circle)
+            circle = slide.shapes.add_shape(
+                MSO_SHAPE.OVAL,
+                Inches(x - 0.15), Inches(line_y - 0.15), Inches(0.3), Inches(0.3)
+            )
+            circle.fill.solid()
+            circle.fill.fore_color.rgb = self.colors[color_key]
+            circle.line.fill.background()
 
             # Year label
-            ax.text(x, 2.3, year, ha='center', fontsize=11, fontweight='bold')
+            year_box = slide.shapes.add_textbox(
+                Inches(x - label_width / 2), Inches(line_y - 0.6), Inches(label_width), Inches(0.3)
+            )
+            p = year_box.text_frame.paragraphs[0]
+            p.text = year
+            p.font.name = 'Segoe UI'
+            p.font.size = Pt(11)
+            p.font.bold = True
+            p.font.color.rgb = self.colors['dark_gray']
+            p.alignment = PP_ALIGN.CENTER
 
             # Details
-            ax.text(x, 0.7, details, ha='center', fontsize=9, color='gray')
-
-        ax.set_title('5-Year Scale Roadmap', fontsize=13, fontweight='bold', y=0.95)
-
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
-        buf.seek(0)
-        return buf
+            details_box = slide.shapes.add_textbox(
+                Inches(x - label_width / 2), Inches(line_y + 0.25), Inches(label_width), Inches(0.5)
+            )
+            tf = details_box.text_frame
+            for i, line in enumerate(details.split("\n")):
+                p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+                p.text = line
+                p.font.name = 'Segoe UI'
+                p.font.size = Pt(9)
+                p.font.color.rgb = self.colors['medium_gray']
+                p.alignment = PP_ALIGN.CENTER
 
     def create_slide1_opportunity(self):
         """Slide 1: Opportunity Landscape"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
 
         # Title and subtitle
         self._add_title(
@@ -432,7 +778,6 @@ class HealthcarePresentationCreator:
         # Left section - Macro Trends
         macro_title = slide.shapes.add_textbox(Inches(0.5), Inches(1.9), Inches(5.5), Inches(0.4))
         tf = macro_title.text_frame
-        tf.clear()
         p = tf.paragraphs[0]
         p.text = "📊 MACRO TRENDS"
         p.font.name = 'Segoe UI Semibold'
@@ -454,7 +799,6 @@ class HealthcarePresentationCreator:
             # Icon
             icon_box = slide.shapes.add_textbox(Inches(0.6), Inches(y_pos), Inches(0.4), Inches(0.35))
             tf = icon_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = icon
             p.font.size = Pt(18)
@@ -463,7 +807,6 @@ class HealthcarePresentationCreator:
             # Text
             text_box = slide.shapes.add_textbox(Inches(1.1), Inches(y_pos), Inches(4.8), Inches(0.35))
             tf = text_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = text
             p.font.name = 'Segoe UI'
@@ -475,7 +818,6 @@ class HealthcarePresentationCreator:
         # Right section - Underserved Sectors
         sectors_title = slide.shapes.add_textbox(Inches(6.5), Inches(1.9), Inches(6), Inches(0.4))
         tf = sectors_title.text_frame
-        tf.clear()
         p = tf.paragraphs[0]
         p.text = "🎯 UNDERSERVED SECTORS"
         p.font.name = 'Segoe UI Semibold'
@@ -494,18 +836,15 @@ class HealthcarePresentationCreator:
         y_pos = 2.4
         for icon, title, desc in sector_items:
             # Container box with light background
-            container = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(6.6), Inches(y_pos), Inches(6.2), Inches(0.5)
+            self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(6.6), Inches(y_pos), Inches(6.2), Inches(0.5),
+                self.colors['very_light_gray']
             )
-            container.fill.solid()
-            container.fill.fore_color.rgb = self.colors['very_light_gray']
-            container.line.fill.background()
 
             # Icon
             icon_box = slide.shapes.add_textbox(Inches(6.7), Inches(y_pos + 0.05), Inches(0.4), Inches(0.4))
             tf = icon_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = icon
             p.font.size = Pt(16)
@@ -513,7 +852,6 @@ class HealthcarePresentationCreator:
             # Title and description
             text_box = slide.shapes.add_textbox(Inches(7.2), Inches(y_pos + 0.05), Inches(5.5), Inches(0.4))
             tf = text_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             run = p.add_run()
             run.text = f"{title}: "
@@ -532,12 +870,11 @@ class HealthcarePresentationCreator:
 
         # Add visuals
         # India map
-        map_img = self._create_india_map_visual()
-        slide.shapes.add_picture(map_img, Inches(0.5), Inches(4.8), Inches(3), Inches(2))
+        self._add_india_map(slide, 0.5, 4.8, 3)
 
         # Infrastructure comparison chart
-        chart_img = self._create_infrastructure_comparison_chart()
-        slide.shapes.add_picture(chart_img, Inches(4), Inches(4.8), Inches(4.5), Inches(2))
+        chart_img = self._chart_png(self._create_infrastructure_comparison_chart)
+        self._add_chart_image(slide, chart_img, Inches(4), Inches(4.8), Inches(4.5), Inches(2))
 
         # Bottom banner
         self._add_bottom_banner(slide, "Digital readiness + structural gaps = fertile ground for disruption")
@@ -545,7 +882,7 @@ class HealthcarePresentationCreator:
 
     def create_slide2_healthcare(self):
         """Slide 2: Healthcare Focus"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
 
         # Title
         self._add_title(
@@ -570,14 +907,11 @@ class HealthcarePresentationCreator:
         x_pos = 0.5
         for icon, title, points in pillars:
             # Pillar container
-            container = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(y_start), Inches(pillar_width), Inches(1.3)
+            self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), Inches(y_start), Inches(pillar_width), Inches(1.3),
+                self.colors['very_light_gray'], self.colors['primary_blue'], Pt(1)
             )
-            container.fill.solid()
-            container.fill.fore_color.rgb = self.colors['very_light_gray']
-            container.line.color.rgb = self.colors['primary_blue']
-            container.line.width = Pt(1)
 
             # Icon and title
             title_box = slide.shapes.add_textbox(
@@ -585,7 +919,6 @@ class HealthcarePresentationCreator:
                 Inches(pillar_width - 0.2), Inches(0.4)
             )
             tf = title_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = f"{icon} {title}"
             p.font.name = 'Segoe UI Semibold'
@@ -599,22 +932,16 @@ class HealthcarePresentationCreator:
                 Inches(x_pos + 0.2), Inches(y_start + 0.5),
                 Inches(pillar_width - 0.4), Inches(0.7)
             )
-            tf = points_box.text_frame
-            tf.clear()
-            for point in points:
-                p = tf.add_paragraph()
-                p.text = f"• {point}"
-                p.font.name = 'Segoe UI'
-                p.font.size = Pt(11)
-                p.font.color.rgb = self.colors['dark_gray']
-                p.space_before = Pt(2)
+            points_body = parse_xml(P_BATCH_OPEN + ''.join(
+                _spaced_p_xml(point, 'Segoe UI', 11, self.hex_colors['dark_gray'], 2, bullet=True) for point in points
+            ) + P_BATCH_CLOSE)
+            points_box.text_frame._txBody.extend(list(points_body))
 
             x_pos += pillar_width + pillar_spacing
 
         # Market Potential section
         market_title = slide.shapes.add_textbox(Inches(0.5), Inches(2.8), Inches(6), Inches(0.4))
         tf = market_title.text_frame
-        tf.clear()
         p = tf.paragraphs[0]
         p.text = "📈 MARKET POTENTIAL"
         p.font.name = 'Segoe UI Semibold'
@@ -637,20 +964,17 @@ class HealthcarePresentationCreator:
                     stat = market_stats[i + j]
                     x = 0.5 + (j * 3.2)
 
-                    stat_box = slide.shapes.add_shape(
-                        MSO_SHAPE.ROUNDED_RECTANGLE,
-                        Inches(x), Inches(y_pos), Inches(3), Inches(0.7)
+                    self._add_box(
+                        slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                        Inches(x), Inches(y_pos), Inches(3), Inches(0.7),
+                        RGBColor(240, 255, 240)
                     )
-                    stat_box.fill.solid()
-                    stat_box.fill.fore_color.rgb = RGBColor(240, 255, 240)
-                    stat_box.line.fill.background()
 
                     text_box = slide.shapes.add_textbox(
                         Inches(x + 0.1), Inches(y_pos + 0.05),
                         Inches(2.8), Inches(0.6)
                     )
                     tf = text_box.text_frame
-                    tf.clear()
                     p = tf.paragraphs[0]
                     run = p.add_run()
                     run.text = stat[0] + "\n"
@@ -668,12 +992,11 @@ class HealthcarePresentationCreator:
 
         # Add visuals
         # Competitive matrix
-        matrix_img = self._create_competitive_matrix()
-        slide.shapes.add_picture(matrix_img, Inches(6.8), Inches(2.8), Inches(6), Inches(3.8))
+        self._add_competitive_matrix(slide, 6.8, 2.8, 6, 3.8)
 
         # Healthcare financing pie
-        pie_img = self._create_healthcare_financing_pie()
-        slide.shapes.add_picture(pie_img, Inches(0.3), Inches(5.2), Inches(3.5), Inches(1.5))
+        pie_img = self._chart_png(self._create_healthcare_financing_pie)
+        self._add_chart_image(slide, pie_img, Inches(0.3), Inches(5.2), Inches(3.5), Inches(1.5))
 
         # Bottom banner
         self._add_bottom_banner(slide, "Healthcare = burning platform → unmet need + adoption proof + policy push")
@@ -681,7 +1004,7 @@ class HealthcarePresentationCreator:
 
     def create_slide3_medichain(self):
         """Slide 3: MediChain Solution"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
 
         # Title
         self._add_title(
@@ -697,18 +1020,23 @@ class HealthcarePresentationCreator:
             ("💊", "Phygital Linkages", "Local pharmacies\nLast-mile medicine")
         ]
 
+        # Loop-invariant colors and sizes
+        box_fill = RGBColor(240, 248, 255)
+        primary_blue = self.colors['primary_blue']
+        dark_navy = self.colors['dark_navy']
+        medium_gray_hex = self.hex_colors['medium_gray']
+        dark_gray = self.colors['dark_gray']
+        size_24, size_12, size_11, size_2 = Pt(24), Pt(12), Pt(11), Pt(2)
+
         x_pos = 0.5
         component_width = 3.1
         for icon, title, desc in components:
             # Component box
-            comp_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(1.2), Inches(component_width), Inches(1.2)
+            self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), Inches(1.2), Inches(component_width), Inches(1.2),
+                box_fill, primary_blue, size_2
             )
-            comp_box.fill.solid()
-            comp_box.fill.fore_color.rgb = RGBColor(240, 248, 255)
-            comp_box.line.color.rgb = self.colors['primary_blue']
-            comp_box.line.width = Pt(2)
 
             # Icon
             icon_box = slide.shapes.add_textbox(
@@ -716,10 +1044,9 @@ class HealthcarePresentationCreator:
                 Inches(0.6), Inches(0.4)
             )
             tf = icon_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = icon
-            p.font.size = Pt(24)
+            p.font.size = size_24
             p.alignment = PP_ALIGN.CENTER
 
             # Title and description
@@ -728,29 +1055,18 @@ class HealthcarePresentationCreator:
                 Inches(component_width - 0.2), Inches(0.4)
             )
             tf = text_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = title
-            p.font.name = 'Segoe UI Semibold'
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['dark_navy']
+            self._apply_font(p, 'Segoe UI Semibold', size_12, dark_navy, bold=True)
             p.alignment = PP_ALIGN.CENTER
 
-            p = tf.add_paragraph()
-            p.text = desc
-            p.font.name = 'Segoe UI'
-            p.font.size = Pt(10)
-            p.font.color.rgb = self.colors['medium_gray']
-            p.alignment = PP_ALIGN.CENTER
-            p.space_before = Pt(2)
+            tf._txBody.append(parse_xml(_spaced_p_xml(desc, 'Segoe UI', 10, medium_gray_hex, 2, centered=True)))
 
             x_pos += component_width + 0.15
 
         # Differentiators section
-        diff_title = slide.shapes.add_textbox(Inches(0.5), Inches(2.6), Inches(5), Inches(0.4))
+        diff_title = slide.shapes.add_textbox(*SLIDE3_DIFF_TITLE)
         tf = diff_title.text_frame
-        tf.clear()
         p = tf.paragraphs[0]
         p.text = "⭐ KEY DIFFERENTIATORS"
         p.font.name = 'Segoe UI Semibold'
@@ -765,22 +1081,18 @@ class HealthcarePresentationCreator:
             "🤝 Trust: Kiosk placement in pharmacies + NGO/state tie-ups"
         ]
 
-        y_pos = 3.0
+        left, top, width, height = SLIDE3_DIFF_POINT
         for point in diff_points:
-            point_box = slide.shapes.add_textbox(Inches(0.6), Inches(y_pos), Inches(5), Inches(0.35))
+            point_box = slide.shapes.add_textbox(left, top, width, height)
             tf = point_box.text_frame
-            tf.clear()
             p = tf.paragraphs[0]
             p.text = point
-            p.font.name = 'Segoe UI'
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['dark_gray']
-            y_pos += 0.4
+            self._apply_font(p, 'Segoe UI', size_11, dark_gray)
+            top += SLIDE3_DIFF_POINT_STEP
 
         # Impact & Scale section
-        impact_title = slide.shapes.add_textbox(Inches(0.5), Inches(4.5), Inches(5), Inches(0.4))
+        impact_title = slide.shapes.add_textbox(*SLIDE3_IMPACT_TITLE)
         tf = impact_title.text_frame
-        tf.clear()
         p = tf.paragraphs[0]
         p.text = "🎯 IMPACT & SCALE"
         p.font.name = 'Segoe UI Semibold'
@@ -789,74 +1101,45 @@ class HealthcarePresentationCreator:
         p.font.bold = True
 
         # Impact points in two columns
-        impact_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(0.5), Inches(4.95), Inches(5.5), Inches(1.8)
-        )
-        impact_box.fill.solid()
-        impact_box.fill.fore_color.rgb = RGBColor(245, 255, 245)
-        impact_box.line.fill.background()
+        self._add_box(slide, MSO_SHAPE.ROUNDED_RECTANGLE, *SLIDE3_IMPACT_BOX, RGBColor(245, 255, 245))
 
-        impact_text = slide.shapes.add_textbox(Inches(0.7), Inches(5.05), Inches(5.2), Inches(1.6))
-        tf = impact_text.text_frame
-        tf.clear()
+        impact_text = slide.shapes.add_textbox(*SLIDE3_IMPACT_TEXT)
 
-        p = tf.add_paragraph()
-        p.text = "Economic Impact:"
-        p.font.name = 'Segoe UI Semibold'
-        p.font.size = Pt(11)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark_navy']
-
-        economic_points = [
-            "• Low OOP burden for families",
-            "• Scalable subscription revenue",
-            "• Job creation in rural areas"
-        ]
-
-        for point in economic_points:
-            p = tf.add_paragraph()
-            p.text = point
-            p.font.name = 'Segoe UI'
-            p.font.size = Pt(10)
-            p.font.color.rgb = self.colors['dark_gray']
-            p.space_before = Pt(1)
-
-        p = tf.add_paragraph()
-        p.text = "\nSocial Impact:"
-        p.font.name = 'Segoe UI Semibold'
-        p.font.size = Pt(11)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark_navy']
-        p.space_before = Pt(4)
-
-        social_points = [
-            "• Access for 100M+ underserved",
-            "• Preventive care culture",
-            "• SDG-3 alignment"
-        ]
-
-        for point in social_points:
-            p = tf.add_paragraph()
-            p.text = point
-            p.font.name = 'Segoe UI'
-            p.font.size = Pt(10)
-            p.font.color.rgb = self.colors['dark_gray']
-            p.space_before = Pt(1)
+        # The paragraph batch is serialized once per process and only parsed here
+        impact_text.text_frame._txBody.extend(list(parse_xml(
+            _impact_paragraphs_xml(self.hex_colors['dark_navy'], self.hex_colors['dark_gray'])
+        )))
 
         # Add visuals
         # Conversion funnel
-        funnel_img = self._create_conversion_funnel()
-        slide.shapes.add_picture(funnel_img, Inches(6.2), Inches(2.6), Inches(3.5), Inches(4))
+        funnel_img = self._chart_png(self._create_conversion_funnel)
+        self._add_chart_image(slide, funnel_img, *SLIDE3_FUNNEL)
 
         # Roadmap
-        roadmap_img = self._create_roadmap_visual()
-        slide.shapes.add_picture(roadmap_img, Inches(9.8), Inches(3.8), Inches(3.3), Inches(2.8))
+        self._add_roadmap(slide, 9.8, 3.8, 3.3, 2.8)
 
         # Bottom banner
         self._add_bottom_banner(slide, "MediChain = Vernacular, trust-first, affordable healthcare pathway for Bharat")
         self._add_footer(slide, 3)
 
+    def save(self, output_path):
+        """Write the presentation to output_path with fast zip compression"""
+        package = self.prs.part.package
+        buf = io.BytesIO()
+        FastPackageWriter.write(buf, package._rels, tuple(package.iter_parts()))
+
+        # One large write to a temp file, then an atomic rename: slow mounts such as
+        # /mnt/e under WSL see a single write and never a half-written deck
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(buf.getbuffer())
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     def generate_presentation(self):
         """Generate the complete presentation"""
         self.create_slide1_opportunity()
@@ -865,11 +1148,15 @@ class HealthcarePresentationCreator:
 
         # Save to PPT Generated folder
         output_path = "/mnt/e/AI and Projects/Case Comp PPT/PPT Generated/Tier23_Healthcare_Disruption.pptx"
-        self.prs.save(output_path)
+        self.save(output_path)
         print(f"Presentation saved to: {output_path}")
         return output_path
 
 if __name__ == "__main__":
+    # Script runs only: render headless and keep matplotlib's font cache in a stable directory
+    # so the font scan is reused across runs. Importers keep their own matplotlib environment
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    os.environ.setdefault('MPLCONFIGDIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.matplotlib'))
     creator = HealthcarePresentationCreator()
     output_file = creator.generate_presentation()
     print(f"\n✅ Tier-2/3 Healthcare Disruption presentation created successfully!")
@@ -7,41 +7,357 @@ Inspired by IIM Ranchi and XIMB SRC best practices
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_VERTICAL_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.chart.data import ChartData
-from pptx.enum.chart import XL_CHART_TYPE
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-import numpy as np
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from xml.sax.saxutils import escape
+import copy
+import hashlib
 import io
-from datetime import datetime
+import os
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+# Professional color scheme
+PRIMARY = RGBColor(0, 102, 204)     # Professional Blue
+SECONDARY = RGBColor(255, 103, 31)  # Orange (XIMB style)
+ACCENT = RGBColor(0, 176, 240)      # Light Blue
+SUCCESS = RGBColor(0, 176, 80)      # Green
+WARNING = RGBColor(255, 192, 0)     # Yellow
+DANGER = RGBColor(220, 53, 69)      # Red
+PURPLE = RGBColor(102, 45, 145)     # Purple
+DARK = RGBColor(51, 51, 51)         # Dark Gray
+GRAY = RGBColor(128, 128, 128)      # Medium Gray
+LIGHT = RGBColor(241, 241, 241)     # Light Gray
+WHITE = RGBColor(255, 255, 255)     # White
+
+# Lengths for the literal dimensions used by the slide builders, converted once at import
+INCHES = {v: Inches(v) for v in (
+    0, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1, 1.2, 1.3, 1.5, 1.7, 1.8, 2, 2.2,
+    2.3, 2.5, 2.8, 3, 3.5, 3.8, 4, 4.3, 4.5, 5, 5.5, 5.8, 6, 6.3, 6.5, 6.8, 7, 7.1, 7.5, 8.3, 11.3,
+    12.3, 13.333
+)}
+POINTS = {v: Pt(v) for v in (
+    1, 1.5, 2, 3, 9, 10, 11, 12, 14, 16, 18, 20, 24, 32
+)}
+
+# Paragraph as p.text plus _style_paragraph and line_spacing would write it
+PARAGRAPH_XML = (
+    '<a:p ' + nsdecls('a') + '><a:pPr{align}>{spacing}<a:defRPr sz="{size}"{bold}><a:solidFill>'
+    '<a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr>{runs}</a:p>'
+)
+RUN_XML = '<a:r><a:t>%s</a:t></a:r>'
+# Run as run.text plus font size, bold and color would write it, and a paragraph of such runs
+STYLED_RUN_XML = (
+    '<a:r><a:rPr sz="{size}"{bold}><a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r>'
+)
+RUN_PARAGRAPH_XML = '<a:p>%s</a:p>'
+LINE_SPACING_XML = '<a:lnSpc><a:spcPct val="%d"/></a:lnSpc>'
+BOLD_ATTRS = {True: ' b="1"', False: ' b="0"', None: ''}
+# Detached container for parsing a batch of <a:p> elements at once
+P_BATCH_XML = '<a:txBody ' + nsdecls('a') + '>%s</a:txBody>'
+# One navigation bar chevron as _add_box plus the label styling would write it. Kept as one preset
+# shape per section: prstGeom is ~50 bytes of the ~900, and a merged custGeom path would still need
+# a second shape for the highlighted fill plus a text box per label
+NAV_ITEM_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Chevron {number}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="chevron"><a:avLst/></a:prstGeom><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln></p:spPr><p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="2"><a:schemeClr val="accent1"/>'
+    '</a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style><p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"><a:defRPr sz="900" b="1">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr><a:r><a:t>{text}</a:t></a:r>'
+    '</a:p></p:txBody></p:sp>'
+)
+# One borderless rounded box of text as _add_box plus its paragraphs would write it
+COLOR_BOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Rounded Rectangle {number}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln></p:spPr><p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="2"><a:schemeClr val="accent1"/>'
+    '</a:effectRef><a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style><p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+)
+# Timeline phase marker as _add_box would write a SECONDARY oval with a 2pt white outline
+TIMELINE_MARKER_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="Oval {number}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="ellipse"><a:avLst/></a:prstGeom><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>'
+    '<a:ln w="{line_width}"><a:solidFill><a:srgbClr val="{line}"/></a:solidFill></a:ln></p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="3">'
+    '<a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style><p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody></p:sp>'
+)
+# Text box as add_textbox plus its paragraphs would write it
+TEXT_BOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {number}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr><p:txBody>'
+    '<a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+)
+# Mini chart styling, applied through rc_context while each chart is built
+CHART_RC = {
+    'axes.spines.top': False, 'axes.spines.right': False, 'axes.spines.left': False,
+    'axes.grid': True, 'axes.grid.axis': 'y', 'axes.axisbelow': True, 'grid.linestyle': '-',
+    'grid.alpha': 0.2, 'xtick.bottom': False, 'xtick.top': False, 'xtick.labelsize': 8
+}
+# Detached container for parsing a batch of <p:sp> elements at once
+SP_BATCH_XML = '<p:spTree ' + nsdecls('p', 'a') + '>%s</p:spTree>'
+# Paragraph font as p.font size, bold and color would write it
+DEF_RPR_XML = (
+    '<a:defRPr ' + nsdecls('a') + ' sz="%d"%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:defRPr>'
+)
+
+@lru_cache(maxsize=None)
+def _def_rpr(size, bold, rgb):
+    """Parsed <a:defRPr> for one paragraph style (size in centipoints), built once and copied on use"""
+    return parse_xml(DEF_RPR_XML % (size, BOLD_ATTRS[bold], rgb))
+
+# Leading shapes of each slide builder, drawn by UltraCondensedPPT._render:
+# (kind, left, top, width, height, color, size, bold, align, text); text is a
+# literal or a callable on case_data, and banners are filled with color behind white text
+LAYOUTS = {
+    'title_context': (
+        ('text', 1, 1.5, 11.3, 1, PRIMARY, 32, True, PP_ALIGN.CENTER, lambda d: d['title'].upper()),
+        ('text', 1, 2.5, 11.3, 0.6, SECONDARY, 20, None, PP_ALIGN.CENTER, itemgetter('subtitle')),
+    ),
+    'problem_analysis': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "PROBLEM ANALYSIS"),
+        ('banner', 0.5, 1, 12.3, 0.8, DANGER, 16, True, PP_ALIGN.CENTER, itemgetter('problem_statement')),
+    ),
+    'strategic_solution': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "STRATEGIC SOLUTION"),
+        ('banner', 0.5, 1, 12.3, 0.8, SUCCESS, 18, True, PP_ALIGN.CENTER, itemgetter('solution_name')),
+    ),
+    'implementation_roadmap': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "IMPLEMENTATION ROADMAP"),
+    ),
+    'impact_recommendations': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "FINANCIAL IMPACT & NEXT STEPS"),
+    ),
+    'problem_opportunity': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, lambda d: f"{d['company']} | {d['title']}"),
+    ),
+    'solution_analysis': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "STRATEGIC SOLUTION & FRAMEWORK"),
+    ),
+    'implementation_impact': (
+        ('text', 0.5, 0.3, 12.3, 0.6, PRIMARY, 24, True, None, "IMPLEMENTATION ROADMAP & EXPECTED IMPACT"),
+    ),
+}
+
 
 class UltraCondensedPPT:
+    __slots__ = ('prs', 'blank_layout', '_shape_templates', '_nav_bars', '_image_parts', '_img_buf')
+    
+    # Read-only view of the palette by name; the builders use the module constants directly
+    colors = MappingProxyType({
+        'primary': PRIMARY, 'secondary': SECONDARY, 'accent': ACCENT, 'success': SUCCESS,
+        'warning': WARNING, 'danger': DANGER, 'purple': PURPLE, 'dark': DARK, 'gray': GRAY,
+        'light': LIGHT, 'white': WHITE
+    })
+    
+    # Per-builder accent cycles, shared instead of rebuilt on every call
+    _STAT_COLORS = (PRIMARY, SECONDARY, PURPLE)
+    _FACTOR_COLORS = (WARNING, DANGER, PURPLE)
+    _PHASE_COLORS = (WARNING, SECONDARY, SUCCESS)
+    _METRIC_COLORS = (PRIMARY, SECONDARY, PURPLE, WARNING)
+    _PILLAR_COLORS = (PRIMARY, SUCCESS, SECONDARY)
+    _QUADRANT_COLORS = (WARNING, SUCCESS, DANGER, PRIMARY)
+    _INITIATIVE_COLORS = (PRIMARY, SECONDARY, PURPLE, SUCCESS, WARNING, DANGER)
+    
     def __init__(self):
         self.prs = Presentation()
-        self.prs.slide_width = Inches(13.333)  # 16:9 widescreen
-        self.prs.slide_height = Inches(7.5)
-        
-        # Professional color scheme
-        self.colors = {
-            'primary': RGBColor(0, 102, 204),     # Professional Blue
-            'secondary': RGBColor(255, 103, 31),  # Orange (XIMB style)
-            'accent': RGBColor(0, 176, 240),      # Light Blue
-            'success': RGBColor(0, 176, 80),      # Green
-            'warning': RGBColor(255, 192, 0),     # Yellow
-            'danger': RGBColor(220, 53, 69),      # Red
-            'purple': RGBColor(102, 45, 145),     # Purple
-            'dark': RGBColor(51, 51, 51),         # Dark Gray
-            'gray': RGBColor(128, 128, 128),      # Medium Gray
-            'light': RGBColor(241, 241, 241),     # Light Gray
-            'white': RGBColor(255, 255, 255)      # White
-        }
+        self.prs.slide_width = INCHES[13.333]  # 16:9 widescreen
+        self.prs.slide_height = INCHES[7.5]
+        
+        # Every slide uses the blank layout; drop the other ten so they are not written out. The
+        # builders pass self.blank_layout to add_slide, which names the new part from the slide
+        # count, so adding slides needs no layout lookup or partname scan
+        layouts = self.prs.slide_layouts
+        self.blank_layout = layouts[6]
+        for layout in [l for l in layouts if l is not self.blank_layout]:
+            layouts.remove(layout)
+        
+        # Detached <p:sp> elements keyed by (preset, fill, line, line width)
+        self._shape_templates = {}
+        
+        # Detached all-gray navigation bar chevrons keyed by the tuple of section names
+        self._nav_bars = {}
+        
+        # Image parts keyed by the SHA-256 of their PNG bytes
+        self._image_parts = {}
+        
+        # Buffer each mini chart's PNG is rendered into
+        self._img_buf = io.BytesIO()
+        
+    def _style_paragraph(self, p, size, bold, rgb, align=None):
+        """Apply size, bold, color and alignment to a paragraph; None leaves a property unset"""
+        pPr = p._p.get_or_add_pPr()
+        pPr._remove_defRPr()
+        pPr._insert_defRPr(copy.deepcopy(_def_rpr(size.centipoints, bold, str(rgb))))
+        if align is not None:
+            p.alignment = align
+            
+    def _runs_xml(self, texts, size, bold, rgb):
+        """XML for one styled run per text (size in points); bold=None leaves it unset"""
+        return ''.join(STYLED_RUN_XML.format(
+            size=size * 100, bold=BOLD_ATTRS[bold], color=rgb, text=escape(text)
+        ) for text in texts)
+        
+    def _add_runs(self, p, texts, size, bold, rgb):
+        """Append one styled run per text to paragraph p in one parse"""
+        runs = parse_xml(P_BATCH_XML % (RUN_PARAGRAPH_XML % self._runs_xml(texts, size, bold, rgb)))[0]
+        p._p.extend(list(runs))
+        
+    def _add_run_paragraphs(self, tf, texts, per_paragraph, size, bold, rgb):
+        """Append paragraphs of per_paragraph styled runs each to tf in one parse"""
+        items_xml = ''.join(
+            RUN_PARAGRAPH_XML % self._runs_xml(texts[i:i + per_paragraph], size, bold, rgb)
+            for i in range(0, len(texts), per_paragraph)
+        )
+        tf._txBody.extend(list(parse_xml(P_BATCH_XML % items_xml)))
+        
+    def _paragraphs_xml(self, rows):
+        """XML for one paragraph per (text, size_pt, bold, rgb, line_spacing, align) row"""
+        return ''.join(PARAGRAPH_XML.format(
+            align=f' algn="{align.xml_value}"' if align is not None else '',
+            spacing=LINE_SPACING_XML % round(line_spacing * 100000) if line_spacing else '',
+            size=size * 100, bold=BOLD_ATTRS[bold], color=rgb,
+            runs='<a:br/>'.join(RUN_XML % escape(line) if line else '' for line in text.split('\n'))
+        ) for text, size, bold, rgb, line_spacing, align in rows)
+        
+    def _bulk_paragraphs(self, tf, rows):
+        """Append one paragraph per (text, size_pt, bold, rgb, line_spacing, align) row to tf in one parse"""
+        tf._txBody.extend(list(parse_xml(P_BATCH_XML % self._paragraphs_xml(rows))))
+        
+    def _add_bullets(self, tf, texts, size, rgb, line_spacing=None, bold=False):
+        """Append one styled paragraph per text to tf, parsing them all in one go (size in points)"""
+        bold = True if bold else None
+        self._bulk_paragraphs(tf, [(text, size, bold, rgb, line_spacing, None) for text in texts])
+        
+    def _add_box(self, slide, preset, left, top, width, height, fill, line=None, line_width=None, pending=None):
+        """Add a filled shape cloned from a cached template; with pending, queue it for _flush instead"""
+        key = (preset, str(fill), str(line), line_width)
+        template = self._shape_templates.get(key)
+        if template is None:
+            # add_shape writes <a:bodyPr anchor="ctr"/>, so box text is vertically centered without
+            # setting tf.vertical_anchor
+            shape = slide.shapes.add_shape(preset, left, top, width, height)
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = fill
+            if line is None:
+                shape.line.fill.background()
+            else:
+                shape.line.color.rgb = line
+                shape.line.width = line_width
+            template = self._shape_templates[key] = copy.deepcopy(shape._element)
+            if pending is None:
+                return shape
+            slide.shapes._spTree.remove(shape._element)
+            
+        sp = copy.deepcopy(template)
+        shape_id = slide.shapes._next_shape_id + (len(pending) if pending is not None else 0)
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = f"{sp.nvSpPr.cNvPr.name.rsplit(' ', 1)[0]} {shape_id - 1}"
+        sp.x, sp.y, sp.cx, sp.cy = int(left), int(top), int(width), int(height)
+        if pending is None:
+            slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+        else:
+            pending.append(sp)
+        return slide.shapes._shape_factory(sp)
+        
+    def _render_text(self, slide, left, top, width, height, rgb, size, bold, align, text):
+        """LAYOUTS 'text' row: a plain text box"""
+        tf = slide.shapes.add_textbox(left, top, width, height).text_frame
+        tf.text = text
+        self._style_paragraph(tf.paragraphs[0], POINTS[size], bold, rgb, align)
+        
+    def _render_banner(self, slide, left, top, width, height, rgb, size, bold, align, text):
+        """LAYOUTS 'banner' row: a filled rectangle with white, vertically centered text"""
+        p = self._add_box(slide, MSO_SHAPE.RECTANGLE, left, top, width, height, rgb).text_frame.paragraphs[0]
+        p.text = text
+        self._style_paragraph(p, POINTS[size], bold, WHITE, align)
+        
+    _RENDERERS = {'text': _render_text, 'banner': _render_banner}
+    
+    def _render(self, slide, spec_name, case_data):
+        """Draw the LAYOUTS rows for spec_name onto slide"""
+        for kind, left, top, width, height, rgb, size, bold, align, text in LAYOUTS[spec_name]:
+            self._RENDERERS[kind](
+                self, slide, INCHES[left], INCHES[top], INCHES[width], INCHES[height],
+                rgb, size, bold, align, text(case_data) if callable(text) else text
+            )
+            
+    def _market_stats_section(self, rows, market_stats):
+        """Optional 'market_stats': two highlighted stats under the problem's challenges"""
+        rows.append(("Market Reality:", 12, True, DARK, None, None))
+        rows += [(f"• {stat}", 11, True, DANGER, None, None) for stat in market_stats[:2]]
+        
+    def _opportunity_chart_section(self, slide, chart_data):
+        """Optional 'opportunity_chart_data': mini chart inside the opportunity box"""
+        self._add_mini_chart(slide, chart_data, INCHES[6.3], INCHES[3.5], INCHES[6], INCHES[3])
+        
+    def _social_impact_section(self, rows, social_impact):
+        """Optional 'social_impact': first two metrics under the investment returns"""
+        rows.append(("\nSOCIAL IMPACT", 12, True, WHITE, None, None))
+        rows += [(f"• {metric}: {value}", 10, None, WHITE, None, None) for metric, value in list(social_impact.items())[:2]]
+        
+    # Optional case_data sections per slide area: (key, renderer taking the area's target and the value)
+    _OPTIONAL_SECTIONS = {
+        'problem_box': (('market_stats', _market_stats_section),),
+        'opportunity_box': (('opportunity_chart_data', _opportunity_chart_section),),
+        'investment_box': (('social_impact', _social_impact_section),),
+    }
+    
+    def _render_optional(self, area, case_data, target):
+        """Run the renderer of each optional section of area that case_data provides"""
+        for key, renderer in self._OPTIONAL_SECTIONS[area]:
+            value = case_data.get(key)
+            if value is not None:
+                renderer(self, target, value)
+                
+    def _add_color_boxes(self, slide, boxes):
+        """Add one borderless rounded box per (left, top, width, height, fill, paragraph rows) in one parse"""
+        first_id = slide.shapes._next_shape_id
+        items_xml = ''.join(COLOR_BOX_XML.format(
+            id=first_id + i, number=first_id + i - 1,
+            x=int(left), y=int(top), cx=int(width), cy=int(height),
+            fill=fill, paragraphs=self._paragraphs_xml(rows)
+        ) for i, (left, top, width, height, fill, rows) in enumerate(boxes))
+        slide.shapes._spTree.extend(list(parse_xml(SP_BATCH_XML % items_xml)))
+        
+    def _flush(self, slide, pending):
+        """Append the <p:sp> elements queued by _add_box to the slide in one extend"""
+        slide.shapes._spTree.extend(pending)
+        
+    def _preprocess(self, case_data):
+        """Return a copy of case_data with the headings the slides show in capitals already uppercased"""
+        data = dict(case_data)
+        if 'problem_factors' in data:
+            data['problem_factors'] = {factor.upper(): items for factor, items in data['problem_factors'].items()}
+        if 'solution_pillars' in data:
+            data['solution_pillars'] = [{**pillar, 'name': pillar['name'].upper()} for pillar in data['solution_pillars']]
+        if 'phases' in data:
+            data['phases'] = [{**phase, 'phase': phase['phase'].upper()} for phase in data['phases']]
+        if data.get('framework_type') == '3_pillars':
+            data['framework_data'] = [{**pillar, 'title': pillar['title'].upper()} for pillar in data['framework_data']]
+        return data
         
     def create_3_slide_presentation(self, case_data):
         """Create ultra-condensed 3-slide presentation"""
+        case_data = self._preprocess(case_data)
+        
+        # Not farmed out to worker processes: the deck has a single mini chart, and a worker
+        # spends longer importing python-pptx and matplotlib than this whole build takes
         
         # Slide 1: Problem & Opportunity
         self._create_problem_opportunity_slide(case_data)
@@ -56,6 +372,11 @@ class UltraCondensedPPT:
     
     def create_5_slide_presentation(self, case_data):
         """Create condensed 5-slide presentation"""
+        case_data = self._preprocess(case_data)
+        
+        # The builders run in order on purpose: together they take a few milliseconds of
+        # GIL-bound Python, and they share self.prs.slides and self._shape_templates, so a
+        # thread pool would add locking and overhead without overlapping any work
         
         # Slide 1: Title & Context
         self._create_title_context_slide(case_data)
@@ -76,753 +397,462 @@ class UltraCondensedPPT:
     
     def _create_title_context_slide(self, case_data):
         """5-slide format: Title with context setting"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
-        # Title section
-        title_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(11.3), Inches(1))
-        tf = title_box.text_frame
-        tf.text = case_data['title'].upper()
-        p = tf.paragraphs[0]
-        p.font.size = Pt(32)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        p.alignment = PP_ALIGN.CENTER
-        
-        # Subtitle
-        subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(11.3), Inches(0.6))
-        tf = subtitle_box.text_frame
-        tf.text = case_data['subtitle']
-        p = tf.paragraphs[0]
-        p.font.size = Pt(20)
-        p.font.color.rgb = self.colors['secondary']
-        p.alignment = PP_ALIGN.CENTER
+        # Title and subtitle
+        self._render(slide, 'title_context', case_data)
         
         # Context stats boxes
         stat_width = 3.5
         stat_height = 1.2
         y_pos = 3.8
+        colors = self._STAT_COLORS
+        pending = []
         
         for i, stat in enumerate(case_data['context_stats'][:3]):
             x_pos = 1.5 + (stat_width + 0.5) * i
             
-            stat_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(y_pos),
-                Inches(stat_width), Inches(stat_height)
+            stat_box = self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), INCHES[y_pos],
+                INCHES[stat_width], INCHES[stat_height],
+                colors[i], pending=pending
             )
-            stat_box.fill.solid()
-            colors = [self.colors['primary'], self.colors['secondary'], self.colors['purple']]
-            stat_box.fill.fore_color.rgb = colors[i]
-            stat_box.line.fill.background()
             
             tf = stat_box.text_frame
             p = tf.paragraphs[0]
             p.text = stat
-            p.font.size = Pt(16)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
-            tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+            self._style_paragraph(p, POINTS[16], True, WHITE, PP_ALIGN.CENTER)
             
+        self._flush(slide, pending)
+        
         # Team info
-        team_box = slide.shapes.add_textbox(Inches(1), Inches(6.5), Inches(11.3), Inches(0.5))
+        team_box = slide.shapes.add_textbox(INCHES[1], INCHES[6.5], INCHES[11.3], INCHES[0.5])
         tf = team_box.text_frame
         tf.text = case_data['team']
         p = tf.paragraphs[0]
-        p.font.size = Pt(14)
-        p.font.color.rgb = self.colors['gray']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[14], None, GRAY, PP_ALIGN.CENTER)
         
     def _create_problem_analysis_slide(self, case_data):
         """5-slide format: Deep problem analysis"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-        
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "PROBLEM ANALYSIS"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
-        # Problem statement banner
-        statement_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(1),
-            Inches(12.3), Inches(0.8)
-        )
-        statement_box.fill.solid()
-        statement_box.fill.fore_color.rgb = self.colors['danger']
-        statement_box.line.fill.background()
-        
-        tf = statement_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = case_data['problem_statement']
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
-        tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+        # Title and banner
+        self._render(slide, 'problem_analysis', case_data)
         
         # Problem factors (3 columns)
         factor_y = 2.2
         factor_width = 3.8
         
-        colors = [self.colors['warning'], self.colors['danger'], self.colors['purple']]
+        colors = self._FACTOR_COLORS
+        pending = []
         
         for i, (factor, items) in enumerate(case_data['problem_factors'].items()):
             x_pos = 0.5 + (factor_width + 0.3) * i
             
             # Factor box
-            factor_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(factor_y),
-                Inches(factor_width), Inches(2)
+            factor_box = self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), INCHES[factor_y],
+                INCHES[factor_width], INCHES[2],
+                LIGHT, colors[i], POINTS[2], pending=pending
             )
-            factor_box.fill.solid()
-            factor_box.fill.fore_color.rgb = self.colors['light']
-            factor_box.line.color.rgb = colors[i]
-            factor_box.line.width = Pt(2)
             
             tf = factor_box.text_frame
-            tf.margin_all = Inches(0.2)
+            tf.margin_all = INCHES[0.2]
             
             # Factor title
             p = tf.paragraphs[0]
-            p.text = factor.upper()
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = colors[i]
-            p.alignment = PP_ALIGN.CENTER
+            p.text = factor
+            self._style_paragraph(p, POINTS[14], True, colors[i], PP_ALIGN.CENTER)
             
             # Factor items
-            for item in items:
-                p = tf.add_paragraph()
-                p.text = f"• {item}"
-                p.font.size = Pt(10)
-                p.font.color.rgb = self.colors['dark']
-                p.line_spacing = 1.15
+            self._add_bullets(tf, [f"• {item}" for item in items], 10, DARK, 1.15)
                 
+        self._flush(slide, pending)
+        
         # Impact section
         impact_y = 4.5
-        impact_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(impact_y),
-            Inches(12.3), Inches(1.8)
+        impact_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[impact_y],
+            INCHES[12.3], INCHES[1.8],
+            WHITE, DARK, POINTS[1]
         )
-        impact_box.fill.solid()
-        impact_box.fill.fore_color.rgb = self.colors['white']
-        impact_box.line.color.rgb = self.colors['dark']
-        impact_box.line.width = Pt(1)
         
         tf = impact_box.text_frame
-        tf.margin_all = Inches(0.3)
+        tf.margin_all = INCHES[0.3]
         
         # Impact header
         p = tf.paragraphs[0]
         p.text = "BUSINESS IMPACT"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
+        self._style_paragraph(p, POINTS[14], True, DARK)
         
         # Impact metrics in columns
-        p = tf.add_paragraph()
-        impact_text = "   |   ".join([f"{k}: {v}" for k, v in case_data['problem_impact'].items()])
-        p.text = impact_text
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['danger']
-        p.alignment = PP_ALIGN.CENTER
+        impact_text = "   |   ".join(f"{k}: {v}" for k, v in case_data['problem_impact'].items())
+        self._bulk_paragraphs(tf, [(impact_text, 16, True, DANGER, None, PP_ALIGN.CENTER)])
         
     def _create_strategic_solution_slide(self, case_data):
         """5-slide format: Strategic solution details"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-        
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "STRATEGIC SOLUTION"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        
-        # Solution name banner
-        solution_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(1),
-            Inches(12.3), Inches(0.8)
-        )
-        solution_box.fill.solid()
-        solution_box.fill.fore_color.rgb = self.colors['success']
-        solution_box.line.fill.background()
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
-        tf = solution_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = case_data['solution_name']
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
-        tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+        # Title and banner
+        self._render(slide, 'strategic_solution', case_data)
         
         # Solution pillars
         pillar_y = 2
         pillar_width = 3.8
+        colors = self._STAT_COLORS
+        pending = []
         
         for i, pillar in enumerate(case_data['solution_pillars']):
             x_pos = 0.5 + (pillar_width + 0.3) * i
             
             # Pillar box
-            pillar_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(pillar_y),
-                Inches(pillar_width), Inches(2.3)
+            pillar_box = self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), INCHES[pillar_y],
+                INCHES[pillar_width], INCHES[2.3],
+                colors[i], pending=pending
             )
-            colors = [self.colors['primary'], self.colors['secondary'], self.colors['purple']]
-            pillar_box.fill.solid()
-            pillar_box.fill.fore_color.rgb = colors[i]
-            pillar_box.line.fill.background()
             
             tf = pillar_box.text_frame
-            tf.margin_all = Inches(0.2)
+            tf.margin_all = INCHES[0.2]
             
             # Pillar name
             p = tf.paragraphs[0]
-            p.text = pillar['name'].upper()
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
+            p.text = pillar['name']
+            self._style_paragraph(p, POINTS[14], True, WHITE, PP_ALIGN.CENTER)
             
             # Components
-            for component in pillar['components'][:4]:
-                p = tf.add_paragraph()
-                p.text = f"✓ {component}"
-                p.font.size = Pt(10)
-                p.font.color.rgb = self.colors['white']
-                p.line_spacing = 1.15
+            self._add_bullets(tf, [f"✓ {component}" for component in pillar['components'][:4]], 10, WHITE, 1.15)
                 
+        self._flush(slide, pending)
+        
         # Competitive advantages
-        adv_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(4.5),
-            Inches(12.3), Inches(1.5)
+        adv_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[4.5],
+            INCHES[12.3], INCHES[1.5],
+            LIGHT, SUCCESS, POINTS[1]
         )
-        adv_box.fill.solid()
-        adv_box.fill.fore_color.rgb = self.colors['light']
-        adv_box.line.color.rgb = self.colors['success']
-        adv_box.line.width = Pt(1)
         
         tf = adv_box.text_frame
-        tf.margin_all = Inches(0.2)
+        tf.margin_all = INCHES[0.2]
         
         p = tf.paragraphs[0]
         p.text = "COMPETITIVE ADVANTAGES"
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
+        self._style_paragraph(p, POINTS[12], True, DARK)
         
         # Advantages in grid
-        p = tf.add_paragraph()
         adv_text = "  •  ".join(case_data['competitive_advantages'])
-        p.text = adv_text
-        p.font.size = Pt(11)
-        p.font.color.rgb = self.colors['success']
-        p.font.bold = True
-        p.alignment = PP_ALIGN.CENTER
+        self._bulk_paragraphs(tf, [(adv_text, 11, True, SUCCESS, None, PP_ALIGN.CENTER)])
         
     def _create_implementation_roadmap_slide(self, case_data):
         """5-slide format: Detailed implementation roadmap"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "IMPLEMENTATION ROADMAP"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._render(slide, 'implementation_roadmap', case_data)
         
         # Timeline phases
         phase_y = 1.2
         phase_height = 2.8
         phase_width = 3.8
+        content_y = Inches(phase_y + 0.7)
+        content_width = Inches(phase_width - 0.4)
+        content_height = Inches(phase_height - 0.9)
         
-        colors = [self.colors['warning'], self.colors['secondary'], self.colors['success']]
+        colors = self._PHASE_COLORS
         
         for i, phase in enumerate(case_data['phases']):
             x_pos = 0.5 + (phase_width + 0.3) * i
+            pending = []
             
             # Phase box
-            phase_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(phase_y),
-                Inches(phase_width), Inches(phase_height)
+            self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+                Inches(x_pos), INCHES[phase_y],
+                INCHES[phase_width], INCHES[phase_height],
+                WHITE, colors[i], POINTS[2], pending=pending
             )
-            phase_box.fill.solid()
-            phase_box.fill.fore_color.rgb = self.colors['white']
-            phase_box.line.color.rgb = colors[i]
-            phase_box.line.width = Pt(2)
             
             # Phase header
-            header_box = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                Inches(x_pos), Inches(phase_y),
-                Inches(phase_width), Inches(0.6)
+            header_box = self._add_box(
+                slide, MSO_SHAPE.RECTANGLE,
+                Inches(x_pos), INCHES[phase_y],
+                INCHES[phase_width], INCHES[0.6],
+                colors[i], pending=pending
             )
-            header_box.fill.solid()
-            header_box.fill.fore_color.rgb = colors[i]
-            header_box.line.fill.background()
             
             tf = header_box.text_frame
             p = tf.paragraphs[0]
-            p.text = f"{phase['phase'].upper()} • {phase['timeline']}"
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
-            tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+            p.text = f"{phase['phase']} • {phase['timeline']}"
+            self._style_paragraph(p, POINTS[12], True, WHITE, PP_ALIGN.CENTER)
+            self._flush(slide, pending)
             
             # Phase content
             content_box = slide.shapes.add_textbox(
-                Inches(x_pos + 0.2), Inches(phase_y + 0.7),
-                Inches(phase_width - 0.4), Inches(phase_height - 0.9)
+                Inches(x_pos + 0.2), content_y, content_width, content_height
             )
             tf = content_box.text_frame
             
             # Targets
             p = tf.paragraphs[0]
             p.text = "TARGET"
-            p.font.size = Pt(10)
-            p.font.bold = True
-            p.font.color.rgb = colors[i]
+            self._style_paragraph(p, POINTS[10], True, colors[i])
             
-            p = tf.add_paragraph()
-            p.text = phase['targets']
-            p.font.size = Pt(11)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['dark']
-            
-            # Milestones
-            p = tf.add_paragraph()
-            p.text = "\nKEY MILESTONES"
-            p.font.size = Pt(10)
-            p.font.bold = True
-            p.font.color.rgb = colors[i]
-            
-            for milestone in phase['milestones']:
-                p = tf.add_paragraph()
-                p.text = f"• {milestone}"
-                p.font.size = Pt(9)
-                p.font.color.rgb = self.colors['dark']
-                p.line_spacing = 1.1
+            # Target, then the milestones
+            self._bulk_paragraphs(tf, [
+                (phase['targets'], 11, True, DARK, None, None),
+                ("\nKEY MILESTONES", 10, True, colors[i], None, None),
+            ] + [(f"• {milestone}", 9, None, DARK, 1.1, None) for milestone in phase['milestones']])
                 
         # Partnerships section
-        partner_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(4.3),
-            Inches(12.3), Inches(1.8)
+        partner_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[4.3],
+            INCHES[12.3], INCHES[1.8],
+            LIGHT, PRIMARY, POINTS[1]
         )
-        partner_box.fill.solid()
-        partner_box.fill.fore_color.rgb = self.colors['light']
-        partner_box.line.color.rgb = self.colors['primary']
-        partner_box.line.width = Pt(1)
         
         tf = partner_box.text_frame
-        tf.margin_all = Inches(0.2)
+        tf.margin_all = INCHES[0.2]
         
         p = tf.paragraphs[0]
         p.text = "STRATEGIC PARTNERSHIPS"
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[12], True, PRIMARY, PP_ALIGN.CENTER)
         
         # Partnership grid
-        for i, partner in enumerate(case_data['partnerships']):
-            if i % 2 == 0:
-                p = tf.add_paragraph()
-                p.text = ""
-            
-            run = p.add_run()
-            run.text = f"  •  {partner}"
-            run.font.size = Pt(11)
-            run.font.color.rgb = self.colors['dark']
+        self._add_run_paragraphs(tf, [f"  •  {partner}" for partner in case_data['partnerships']], 2, 11, None, DARK)
             
     def _create_impact_recommendations_slide(self, case_data):
         """5-slide format: Financial impact and recommendations"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "FINANCIAL IMPACT & NEXT STEPS"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._render(slide, 'impact_recommendations', case_data)
         
         # Financial metrics (left side)
-        fin_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(0.5), Inches(1.2),
-            Inches(6), Inches(2.5)
+        fin_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[0.5], INCHES[1.2],
+            INCHES[6], INCHES[2.5],
+            SUCCESS
         )
-        fin_box.fill.solid()
-        fin_box.fill.fore_color.rgb = self.colors['success']
-        fin_box.line.fill.background()
         
         tf = fin_box.text_frame
-        tf.margin_all = Inches(0.3)
+        tf.margin_all = INCHES[0.3]
         
         # Header
         p = tf.paragraphs[0]
         p.text = "FINANCIAL PROJECTIONS (YEAR 3)"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[14], True, WHITE, PP_ALIGN.CENTER)
         
         # Key metrics
         metrics = case_data['financial_projections']['key_metrics']
         for key, value in metrics.items():
             p = tf.add_paragraph()
             p.text = f"{key}: {value}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['white']
-            p.font.bold = True if 'Revenue' in key or 'EBITDA' in key else False
+            self._style_paragraph(p, POINTS[11], True if 'Revenue' in key or 'EBITDA' in key else False, WHITE)
             
         # Investment & ROI (right side)
-        roi_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(6.8), Inches(1.2),
-            Inches(6), Inches(2.5)
+        roi_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[6.8], INCHES[1.2],
+            INCHES[6], INCHES[2.5],
+            PRIMARY
         )
-        roi_box.fill.solid()
-        roi_box.fill.fore_color.rgb = self.colors['primary']
-        roi_box.line.fill.background()
         
         tf = roi_box.text_frame
-        tf.margin_all = Inches(0.3)
+        tf.margin_all = INCHES[0.3]
         
         # ROI header
         p = tf.paragraphs[0]
         p.text = "INVESTMENT RETURNS"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
-        
-        # ROI details
-        p = tf.add_paragraph()
-        p.text = f"Investment Required: {case_data['investment_required']}"
-        p.font.size = Pt(11)
-        p.font.color.rgb = self.colors['white']
+        self._style_paragraph(p, POINTS[14], True, WHITE, PP_ALIGN.CENTER)
         
-        p = tf.add_paragraph()
-        p.text = f"ROI: {case_data['roi']}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
-        
-        p = tf.add_paragraph()
-        p.text = f"Payback Period: {case_data['payback']}"
-        p.font.size = Pt(11)
-        p.font.color.rgb = self.colors['white']
-        
-        # Social impact
-        if 'social_impact' in case_data:
-            p = tf.add_paragraph()
-            p.text = "\nSOCIAL IMPACT"
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            
-            for metric, value in list(case_data['social_impact'].items())[:2]:
-                p = tf.add_paragraph()
-                p.text = f"• {metric}: {value}"
-                p.font.size = Pt(10)
-                p.font.color.rgb = self.colors['white']
+        # ROI details, then social impact when provided
+        rows = [
+            (f"Investment Required: {case_data['investment_required']}", 11, None, WHITE, None, None),
+            (f"ROI: {case_data['roi']}", 18, True, WHITE, None, PP_ALIGN.CENTER),
+            (f"Payback Period: {case_data['payback']}", 11, None, WHITE, None, None),
+        ]
+        self._render_optional('investment_box', case_data, rows)
+        self._bulk_paragraphs(tf, rows)
                 
         # Recommendations section
-        rec_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(4),
-            Inches(12.3), Inches(2.3)
+        rec_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[4],
+            INCHES[12.3], INCHES[2.3],
+            LIGHT, DARK, POINTS[1]
         )
-        rec_box.fill.solid()
-        rec_box.fill.fore_color.rgb = self.colors['light']
-        rec_box.line.color.rgb = self.colors['dark']
-        rec_box.line.width = Pt(1)
         
         tf = rec_box.text_frame
-        tf.margin_all = Inches(0.3)
+        tf.margin_all = INCHES[0.3]
         
         # Recommendations header
         p = tf.paragraphs[0]
         p.text = "IMMEDIATE ACTION ITEMS"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
+        self._style_paragraph(p, POINTS[14], True, DARK)
         
         # Recommendations in 2 columns
-        for i, rec in enumerate(case_data['recommendations']):
-            if i % 2 == 0:
-                p = tf.add_paragraph()
-            
-            run = p.add_run()
-            run.text = f"   {i+1}. {rec}   "
-            run.font.size = Pt(11)
-            run.font.color.rgb = self.colors['dark']
-            run.font.bold = True
+        recs = [f"   {i+1}. {rec}   " for i, rec in enumerate(case_data['recommendations'])]
+        self._add_run_paragraphs(tf, recs, 2, 11, True, DARK)
     
     def _create_problem_opportunity_slide(self, case_data):
         """Slide 1 for 3-slide format: Problem & Opportunity combined"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
         # Title with company name
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = f"{case_data['company']} | {case_data['title']}"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._render(slide, 'problem_opportunity', case_data)
         
         # Add navigation bar (XIMB style)
         self._add_navigation_bar(slide, ['PROBLEM', 'SOLUTION', 'IMPACT'], 0)
         
         # Problem Box (Left side - 40%)
-        problem_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(0.5), Inches(1.5),
-            Inches(5), Inches(5.5)
+        problem_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[0.5], INCHES[1.5],
+            INCHES[5], INCHES[5.5],
+            LIGHT, DANGER, POINTS[2]
         )
-        problem_box.fill.solid()
-        problem_box.fill.fore_color.rgb = self.colors['light']
-        problem_box.line.color.rgb = self.colors['danger']
-        problem_box.line.width = Pt(2)
         
         tf = problem_box.text_frame
-        tf.margin_left = Inches(0.3)
-        tf.margin_top = Inches(0.3)
-        tf.margin_right = Inches(0.3)
+        tf.margin_left = INCHES[0.3]
+        tf.margin_top = INCHES[0.3]
+        tf.margin_right = INCHES[0.3]
         
         # Problem header
         p = tf.paragraphs[0]
         p.text = "CORE PROBLEM"
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['danger']
-        
-        # Problem statement
-        p = tf.add_paragraph()
-        p.text = case_data['problem_statement']
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
-        p.line_spacing = 1.2
-        
-        # Key challenges
-        p = tf.add_paragraph()
-        p.text = "Key Challenges:"
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
+        self._style_paragraph(p, POINTS[16], True, DANGER)
         
-        for challenge in case_data['challenges'][:3]:
-            p = tf.add_paragraph()
-            p.text = f"• {challenge}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['dark']
-            p.line_spacing = 1.15
+        # Problem statement and key challenges
+        rows = [
+            (case_data['problem_statement'], 14, True, DARK, 1.2, None),
+            ("Key Challenges:", 12, True, DARK, None, None),
+        ]
+        rows += [(f"• {challenge}", 11, None, DARK, 1.15, None) for challenge in case_data['challenges'][:3]]
         
         # Market data
-        if 'market_stats' in case_data:
-            p = tf.add_paragraph()
-            p.text = "Market Reality:"
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['dark']
-            
-            for stat in case_data['market_stats'][:2]:
-                p = tf.add_paragraph()
-                p.text = f"• {stat}"
-                p.font.size = Pt(11)
-                p.font.color.rgb = self.colors['danger']
-                p.font.bold = True
+        self._render_optional('problem_box', case_data, rows)
+        self._bulk_paragraphs(tf, rows)
         
         # Opportunity Box (Right side - 55%)
-        opp_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(5.8), Inches(1.5),
-            Inches(7), Inches(5.5)
+        opp_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[5.8], INCHES[1.5],
+            INCHES[7], INCHES[5.5],
+            WHITE, SUCCESS, POINTS[2]
         )
-        opp_box.fill.solid()
-        opp_box.fill.fore_color.rgb = self.colors['white']
-        opp_box.line.color.rgb = self.colors['success']
-        opp_box.line.width = Pt(2)
         
         tf = opp_box.text_frame
-        tf.margin_left = Inches(0.3)
-        tf.margin_top = Inches(0.3)
-        tf.margin_right = Inches(0.3)
+        tf.margin_left = INCHES[0.3]
+        tf.margin_top = INCHES[0.3]
+        tf.margin_right = INCHES[0.3]
         
         # Opportunity header
         p = tf.paragraphs[0]
         p.text = "MARKET OPPORTUNITY"
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['success']
+        self._style_paragraph(p, POINTS[16], True, SUCCESS)
         
-        # Opportunity size
-        p = tf.add_paragraph()
-        p.text = case_data['opportunity_size']
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        p.alignment = PP_ALIGN.CENTER
+        # Opportunity size and growth drivers
+        self._bulk_paragraphs(tf, [
+            (case_data['opportunity_size'], 20, True, PRIMARY, None, PP_ALIGN.CENTER),
+            ("Growth Drivers:", 12, True, DARK, None, None),
+        ] + [(f"✓ {driver}", 11, None, SUCCESS, 1.15, None) for driver in case_data['growth_drivers'][:3]])
         
         # Add visual chart if data provided
-        if 'opportunity_chart_data' in case_data:
-            self._add_mini_chart(slide, case_data['opportunity_chart_data'], 
-                               Inches(6.3), Inches(3.5), Inches(6), Inches(3))
-        
-        # Growth drivers
-        p = tf.add_paragraph()
-        p.text = "Growth Drivers:"
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['dark']
-        
-        for driver in case_data['growth_drivers'][:3]:
-            p = tf.add_paragraph()
-            p.text = f"✓ {driver}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['success']
-            p.line_spacing = 1.15
+        self._render_optional('opportunity_box', case_data, slide)
             
     def _create_solution_analysis_slide(self, case_data):
         """Slide 2 for 3-slide format: Solution & Analysis"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "STRATEGIC SOLUTION & FRAMEWORK"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._render(slide, 'solution_analysis', case_data)
         
         # Navigation bar
         self._add_navigation_bar(slide, ['PROBLEM', 'SOLUTION', 'IMPACT'], 1)
         
         # Solution Overview (Top section)
-        solution_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(0.5), Inches(1.5),
-            Inches(12.3), Inches(1.2)
+        solution_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[0.5], INCHES[1.5],
+            INCHES[12.3], INCHES[1.2],
+            PRIMARY
         )
-        solution_box.fill.solid()
-        solution_box.fill.fore_color.rgb = self.colors['primary']
-        solution_box.line.fill.background()
         
         tf = solution_box.text_frame
-        tf.margin_left = Inches(0.5)
-        tf.margin_right = Inches(0.5)
+        tf.margin_left = INCHES[0.5]
+        tf.margin_right = INCHES[0.5]
         p = tf.paragraphs[0]
         p.text = case_data['solution_statement']
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
-        tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+        self._style_paragraph(p, POINTS[18], True, WHITE, PP_ALIGN.CENTER)
         
         # Framework or Analysis (Middle section)
         if case_data.get('framework_type') == '3_pillars':
             self._add_3_pillar_framework(slide, case_data['framework_data'], 
-                                        Inches(0.5), Inches(3), Inches(12.3), Inches(2.5))
+                                        INCHES[0.5], INCHES[3], INCHES[12.3], INCHES[2.5])
         elif case_data.get('framework_type') == 'matrix':
             self._add_2x2_matrix_condensed(slide, case_data['framework_data'],
-                                          Inches(0.5), Inches(3), Inches(6), Inches(3.5))
+                                          INCHES[0.5], INCHES[3], INCHES[6], INCHES[3.5])
             # Add key strategies on the right
             self._add_key_strategies(slide, case_data['strategies'],
-                                   Inches(7), Inches(3), Inches(5.8), Inches(3.5))
+                                   INCHES[7], INCHES[3], INCHES[5.8], INCHES[3.5])
         else:
             # Default: Key initiatives
             self._add_key_initiatives(slide, case_data['initiatives'],
-                                    Inches(0.5), Inches(3), Inches(12.3), Inches(3.5))
+                                    INCHES[0.5], INCHES[3], INCHES[12.3], INCHES[3.5])
     
     def _create_implementation_impact_slide(self, case_data):
         """Slide 3 for 3-slide format: Implementation & Impact"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self.blank_layout)
         
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.6))
-        tf = title_box.text_frame
-        tf.text = "IMPLEMENTATION ROADMAP & EXPECTED IMPACT"
-        p = tf.paragraphs[0]
-        p.font.size = Pt(24)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._render(slide, 'implementation_impact', case_data)
         
         # Navigation bar
         self._add_navigation_bar(slide, ['PROBLEM', 'SOLUTION', 'IMPACT'], 2)
         
         # Implementation Timeline (Left 60%)
-        timeline_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(1.5),
-            Inches(7.5), Inches(2.2)
+        self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[1.5],
+            INCHES[7.5], INCHES[2.2],
+            WHITE, GRAY, POINTS[1]
         )
-        timeline_box.fill.solid()
-        timeline_box.fill.fore_color.rgb = self.colors['white']
-        timeline_box.line.color.rgb = self.colors['gray']
-        timeline_box.line.width = Pt(1)
         
         # Add timeline visual
         self._add_condensed_timeline(slide, case_data['timeline_phases'],
-                                   Inches(0.7), Inches(1.7), Inches(7.1), Inches(1.8))
+                                   INCHES[0.7], INCHES[1.7], INCHES[7.1], INCHES[1.8])
         
         # Financial Impact (Right 40%)
-        impact_box = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(8.3), Inches(1.5),
-            Inches(4.5), Inches(2.2)
+        impact_box = self._add_box(
+            slide, MSO_SHAPE.ROUNDED_RECTANGLE,
+            INCHES[8.3], INCHES[1.5],
+            INCHES[4.5], INCHES[2.2],
+            SUCCESS
         )
-        impact_box.fill.solid()
-        impact_box.fill.fore_color.rgb = self.colors['success']
-        impact_box.line.fill.background()
         
         tf = impact_box.text_frame
-        tf.margin_all = Inches(0.2)
+        tf.margin_all = INCHES[0.2]
         
         p = tf.paragraphs[0]
         p.text = "EXPECTED IMPACT"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[14], True, WHITE, PP_ALIGN.CENTER)
         
         # ROI
         p = tf.add_paragraph()
         p.text = f"ROI: {case_data['roi']}"
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[20], True, WHITE, PP_ALIGN.CENTER)
         
         # Payback
         p = tf.add_paragraph()
         p.text = f"Payback: {case_data['payback_period']}"
-        p.font.size = Pt(12)
-        p.font.color.rgb = self.colors['white']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[12], None, WHITE, PP_ALIGN.CENTER)
         
         # Key Metrics Dashboard (Bottom section)
         metrics_y = 4
@@ -831,157 +861,116 @@ class UltraCondensedPPT:
         metrics = case_data['key_metrics'][:4]  # Max 4 metrics
         metric_width = 2.8
         metric_spacing = 0.2
+        colors = self._METRIC_COLORS
         
+        boxes = []
         for i, metric in enumerate(metrics):
             x_pos = 0.5 + (metric_width + metric_spacing) * i
             
-            metric_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                Inches(x_pos), Inches(metrics_y),
-                Inches(metric_width), Inches(1.2)
-            )
-            metric_box.fill.solid()
-            colors = [self.colors['primary'], self.colors['secondary'], 
-                     self.colors['purple'], self.colors['warning']]
-            metric_box.fill.fore_color.rgb = colors[i % len(colors)]
-            metric_box.line.fill.background()
-            
-            tf = metric_box.text_frame
-            tf.margin_all = Inches(0.15)
-            
-            # Metric name
-            p = tf.paragraphs[0]
-            p.text = metric['name']
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
-            
-            # Metric value
-            p = tf.add_paragraph()
-            p.text = metric['value']
-            p.font.size = Pt(18)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
+            # Metric name over its value
+            boxes.append((
+                Inches(x_pos), INCHES[metrics_y], INCHES[metric_width], INCHES[1.2], colors[i % len(colors)],
+                [(metric['name'], 11, None, WHITE, None, PP_ALIGN.CENTER),
+                 (metric['value'], 18, True, WHITE, None, PP_ALIGN.CENTER)]
+            ))
             
+        self._add_color_boxes(slide, boxes)
+        
         # Recommendations box (Bottom)
-        rec_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            Inches(0.5), Inches(5.5),
-            Inches(12.3), Inches(1.3)
+        rec_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            INCHES[0.5], INCHES[5.5],
+            INCHES[12.3], INCHES[1.3],
+            LIGHT, PRIMARY, POINTS[1]
         )
-        rec_box.fill.solid()
-        rec_box.fill.fore_color.rgb = self.colors['light']
-        rec_box.line.color.rgb = self.colors['primary']
-        rec_box.line.width = Pt(1)
         
         tf = rec_box.text_frame
-        tf.margin_all = Inches(0.2)
+        tf.margin_all = INCHES[0.2]
         
         p = tf.paragraphs[0]
         p.text = "KEY RECOMMENDATIONS: "
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
+        self._style_paragraph(p, POINTS[12], True, PRIMARY)
         
         # Add recommendations as continuous text
-        rec_text = " | ".join([f"→ {rec}" for rec in case_data['recommendations'][:3]])
-        run = p.add_run()
-        run.text = rec_text
-        run.font.size = Pt(11)
-        run.font.color.rgb = self.colors['dark']
-        run.font.bold = False
+        rec_text = " | ".join(f"→ {rec}" for rec in case_data['recommendations'][:3])
+        self._add_runs(p, [rec_text], 11, False, DARK)
         
     def _add_navigation_bar(self, slide, sections, current_index):
         """Add XIMB-style navigation bar"""
-        bar_y = 1
-        bar_height = 0.3
-        total_width = 12.3
-        section_width = total_width / len(sections)
-        
-        for i, section in enumerate(sections):
-            x_pos = 0.5 + section_width * i
+        # The chevrons only differ between slides in their ids and which one is highlighted, so
+        # they are parsed once per set of sections and cloned for every slide after that
+        chevrons = self._nav_bars.get(tuple(sections))
+        if chevrons is None:
+            bar_y = INCHES[1]
+            bar_height = INCHES[0.3]
+            total_width = 12.3
+            section_width = total_width / len(sections)
             
-            # Create arrow shape
-            if i == current_index:
-                color = self.colors['secondary']  # Orange for current
-            else:
-                color = self.colors['gray']
-                
-            arrow = slide.shapes.add_shape(
-                MSO_SHAPE.CHEVRON,
-                Inches(x_pos), Inches(bar_y),
-                Inches(section_width - 0.05), Inches(bar_height)
-            )
-            arrow.fill.solid()
-            arrow.fill.fore_color.rgb = color
-            arrow.line.fill.background()
+            item_width = Inches(section_width - 0.05)
             
-            # Add text
-            tf = arrow.text_frame
-            tf.margin_all = Inches(0)
-            p = tf.paragraphs[0]
-            p.text = section
-            p.font.size = Pt(9)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
-            tf.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+            items_xml = ''.join(NAV_ITEM_XML.format(
+                id=0, number=0,
+                x=Inches(0.5 + section_width * i), y=bar_y, cx=item_width, cy=bar_height,
+                fill=GRAY, color=WHITE, text=escape(section)
+            ) for i, section in enumerate(sections))
+            chevrons = self._nav_bars[tuple(sections)] = list(parse_xml(SP_BATCH_XML % items_xml))
             
+        # Orange for the current section, gray for the rest
+        first_id = slide.shapes._next_shape_id
+        items = [copy.deepcopy(sp) for sp in chevrons]
+        for i, sp in enumerate(items):
+            sp.nvSpPr.cNvPr.id = first_id + i
+            sp.nvSpPr.cNvPr.name = f"Chevron {first_id + i - 1}"
+        items[current_index].xpath('./p:spPr/a:solidFill/a:srgbClr')[0].set('val', str(SECONDARY))
+        slide.shapes._spTree.extend(items)
+        
     def _add_3_pillar_framework(self, slide, pillars, x, y, width, height):
         """Add 3-pillar framework like IIM Ranchi"""
-        pillar_width = width / 3 - Inches(0.1)
+        pillar_width = width / 3 - INCHES[0.1]
         
-        colors = [self.colors['primary'], self.colors['success'], self.colors['secondary']]
+        colors = self._PILLAR_COLORS
+        pending = []
         
         for i, pillar in enumerate(pillars):
             x_pos = x + (width / 3) * i
             
             # Pillar box
-            pillar_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
+            pillar_box = self._add_box(
+                slide, MSO_SHAPE.ROUNDED_RECTANGLE,
                 x_pos, y,
-                pillar_width, height
+                pillar_width, height,
+                colors[i % len(colors)], pending=pending
             )
-            pillar_box.fill.solid()
-            pillar_box.fill.fore_color.rgb = colors[i % len(colors)]
-            pillar_box.line.fill.background()
             
             tf = pillar_box.text_frame
-            tf.margin_all = Inches(0.2)
+            tf.margin_all = INCHES[0.2]
             
             # Pillar title
             p = tf.paragraphs[0]
-            p.text = pillar['title'].upper()
-            p.font.size = Pt(14)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
+            p.text = pillar['title']
+            self._style_paragraph(p, POINTS[14], True, WHITE, PP_ALIGN.CENTER)
             
             # Pillar items
-            for item in pillar['items'][:4]:  # Max 4 items
-                p = tf.add_paragraph()
-                p.text = f"• {item}"
-                p.font.size = Pt(10)
-                p.font.color.rgb = self.colors['white']
-                p.line_spacing = 1.1
+            self._add_bullets(tf, [f"• {item}" for item in pillar['items'][:4]], 10, WHITE, 1.1)  # Max 4 items
                 
+        self._flush(slide, pending)
+        
     def _add_2x2_matrix_condensed(self, slide, matrix_data, x, y, width, height):
         """Add condensed 2x2 matrix"""
         # Draw cross lines
         h_line = slide.shapes.add_connector(
-            1, x + Inches(0.5), y + height/2, 
-            x + width - Inches(0.5), y + height/2
+            1, x + INCHES[0.5], y + height/2, 
+            x + width - INCHES[0.5], y + height/2
         )
-        h_line.line.color.rgb = self.colors['dark']
-        h_line.line.width = Pt(1.5)
+        h_line.line.color.rgb = DARK
+        h_line.line.width = POINTS[1.5]
         
         v_line = slide.shapes.add_connector(
-            1, x + width/2, y + Inches(0.5),
-            x + width/2, y + height - Inches(0.5)
+            1, x + width/2, y + INCHES[0.5],
+            x + width/2, y + height - INCHES[0.5]
         )
-        v_line.line.color.rgb = self.colors['dark']
-        v_line.line.width = Pt(1.5)
+        v_line.line.color.rgb = DARK
+        v_line.line.width = POINTS[1.5]
         
         # Add quadrant boxes
         quadrants = [
@@ -991,78 +980,91 @@ class UltraCondensedPPT:
             {'x': x + width/2, 'y': y + height/2, 'data': matrix_data[3]}  # Bottom Right
         ]
         
-        colors = [self.colors['warning'], self.colors['success'], 
-                  self.colors['danger'], self.colors['primary']]
+        colors = self._QUADRANT_COLORS
+        box_width = width/2 - INCHES[0.2]
+        box_height = height/2 - INCHES[0.2]
         
         for i, quad in enumerate(quadrants):
             # Create text box for each quadrant
             text_box = slide.shapes.add_textbox(
-                quad['x'] + Inches(0.1), quad['y'] + Inches(0.1),
-                width/2 - Inches(0.2), height/2 - Inches(0.2)
+                quad['x'] + INCHES[0.1], quad['y'] + INCHES[0.1],
+                box_width, box_height
             )
             
             tf = text_box.text_frame
-            tf.margin_all = Inches(0.1)
+            tf.margin_all = INCHES[0.1]
             
             # Quadrant title
             p = tf.paragraphs[0]
             p.text = quad['data']['title']
-            p.font.size = Pt(11)
-            p.font.bold = True
-            p.font.color.rgb = colors[i]
-            p.alignment = PP_ALIGN.CENTER
+            self._style_paragraph(p, POINTS[11], True, colors[i], PP_ALIGN.CENTER)
             
             # Items (condensed)
-            for item in quad['data']['items'][:2]:  # Max 2 items
-                p = tf.add_paragraph()
-                p.text = f"• {item}"
-                p.font.size = Pt(9)
-                p.font.color.rgb = self.colors['dark']
+            self._add_bullets(tf, [f"• {item}" for item in quad['data']['items'][:2]], 9, DARK)  # Max 2 items
                 
     def _add_mini_chart(self, slide, chart_data, x, y, width, height):
         """Add small chart visualization"""
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(width.inches, height.inches))
-        
-        if chart_data['type'] == 'bar':
-            bars = ax.bar(chart_data['labels'], chart_data['values'], 
-                          color='#0066CC')
+        # Imported here so text-only decks never load matplotlib. The figure is drawn on its own Agg
+        # canvas rather than through pyplot, so it is never registered with pyplot's figure manager
+        import matplotlib
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from PIL import Image
+        
+        # CHART_RC only applies while the chart is built, so other matplotlib users keep their styling
+        with matplotlib.rc_context(CHART_RC):
+            # A fresh figure per chart, so each render depends only on chart_data and identical
+            # charts produce identical PNGs that _add_image can share
+            fig = Figure(figsize=(width.inches, height.inches))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            ax.yaxis.set_visible(False)
             
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.0f}', ha='center', va='bottom', fontsize=8)
+            if chart_data['type'] == 'bar':
+                bars = ax.bar(chart_data['labels'], chart_data['values'], 
+                              color='#0066CC')
+            
+                # Add value labels on bars
+                ax.bar_label(bars, fmt='%.0f', fontsize=8)
                        
-        elif chart_data['type'] == 'line':
-            ax.plot(chart_data['x'], chart_data['y'], 
-                   marker='o', linewidth=2, markersize=6,
-                   color='#0066CC')
-            ax.fill_between(chart_data['x'], chart_data['y'], alpha=0.3)
+            elif chart_data['type'] == 'line':
+                xs, ys = list(chart_data['x']), list(chart_data['y'])
+                ax.plot(xs, ys, 
+                       marker='o', linewidth=2, markersize=6,
+                       color='#0066CC')
+                # Area under the line; short series are filled as one polygon down to zero
+                if len(xs) < 8:
+                    ax.fill(xs + xs[::-1], ys + [0] * len(ys), alpha=0.3)
+                else:
+                    ax.fill_between(xs, ys, alpha=0.3)
+            
+            fig.tight_layout()
+            
+            # Render and add to slide. tight_layout has already fitted the axes to the figure, so the
+            # whole figure is drawn without a bbox_inches='tight' measuring pass. 150 dpi covers the
+            # chart's share of a 1080p screen, and the few flat colors fit a 16-color palette PNG
+            fig.set_dpi(150)
+            fig.canvas.draw()
+            chart = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+            img_stream = self._img_buf
+            img_stream.seek(0)
+            img_stream.truncate()
+            chart.convert('P', palette=Image.Palette.ADAPTIVE, colors=16).save(img_stream, 'PNG')
+            
+        self._add_image(slide, img_stream, x, y, width)
+        
+    def _add_image(self, slide, img_stream, x, y, width):
+        """Place a PNG scaled to width, sharing one image part per distinct PNG"""
+        blob = img_stream.getvalue()
+        digest = hashlib.sha256(blob).hexdigest()
+        image_part = self._image_parts.get(digest)
+        if image_part is None:
+            image_part = self.prs.part.package.get_or_add_image_part(io.BytesIO(blob))
+            self._image_parts[digest] = image_part
             
-        # Remove spines and labels for clean look
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.spines['bottom'].set_visible(True)
-        ax.yaxis.set_visible(False)
-        ax.xaxis.set_ticks_position('none')
-        plt.xticks(fontsize=8)
-        
-        # Grid
-        ax.yaxis.grid(True, linestyle='-', alpha=0.2)
-        ax.set_axisbelow(True)
-        
-        plt.tight_layout()
-        
-        # Save and add to slide
-        img_stream = io.BytesIO()
-        plt.savefig(img_stream, format='png', dpi=200, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        img_stream.seek(0)
-        pic = slide.shapes.add_picture(img_stream, x, y, width=width)
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+        slide.shapes._add_pic_from_image_part(image_part, rId, x, y, width, None)
         
     def _add_condensed_timeline(self, slide, phases, x, y, width, height):
         """Add condensed timeline visualization"""
@@ -1073,48 +1075,36 @@ class UltraCondensedPPT:
         timeline_line = slide.shapes.add_connector(
             1, x, line_y, x + width, line_y
         )
-        timeline_line.line.color.rgb = self.colors['primary']
-        timeline_line.line.width = Pt(3)
+        timeline_line.line.color.rgb = PRIMARY
+        timeline_line.line.width = POINTS[3]
+        
+        # Phase markers are centred in equal slots along the line
+        marker_xs = [x + phase_width * i + phase_width/2 - INCHES[0.3] for i in range(len(phases))]
+        circle_y = line_y - INCHES[0.15]
+        duration_y = line_y + INCHES[0.3]
+        
+        # Marker, name (above) and duration (below) for each phase, parsed in one go
+        first_id = slide.shapes._next_shape_id
+        items = []
+        for i, (x_pos, phase) in enumerate(zip(marker_xs, phases)):
+            shape_id = first_id + 3 * i
+            items.append(TIMELINE_MARKER_XML.format(
+                id=shape_id, number=shape_id - 1,
+                x=int(x_pos), y=int(circle_y), cx=INCHES[0.3], cy=INCHES[0.3],
+                fill=SECONDARY, line=WHITE, line_width=POINTS[2]
+            ))
+            items.append(TEXT_BOX_XML.format(
+                id=shape_id + 1, number=shape_id,
+                x=int(x_pos - INCHES[0.5]), y=int(y), cx=INCHES[1.3], cy=INCHES[0.4],
+                paragraphs=self._paragraphs_xml([(phase['name'], 10, True, DARK, None, PP_ALIGN.CENTER)])
+            ))
+            items.append(TEXT_BOX_XML.format(
+                id=shape_id + 2, number=shape_id + 1,
+                x=int(x_pos - INCHES[0.5]), y=int(duration_y), cx=INCHES[1.3], cy=INCHES[0.3],
+                paragraphs=self._paragraphs_xml([(phase['duration'], 9, None, GRAY, None, PP_ALIGN.CENTER)])
+            ))
+        slide.shapes._spTree.extend(list(parse_xml(SP_BATCH_XML % ''.join(items))))
         
-        for i, phase in enumerate(phases):
-            x_pos = x + phase_width * i + phase_width/2 - Inches(0.3)
-            
-            # Phase circle
-            circle = slide.shapes.add_shape(
-                MSO_SHAPE.OVAL,
-                x_pos, line_y - Inches(0.15),
-                Inches(0.3), Inches(0.3)
-            )
-            circle.fill.solid()
-            circle.fill.fore_color.rgb = self.colors['secondary']
-            circle.line.color.rgb = self.colors['white']
-            circle.line.width = Pt(2)
-            
-            # Phase name (above)
-            name_box = slide.shapes.add_textbox(
-                x_pos - Inches(0.5), y,
-                Inches(1.3), Inches(0.4)
-            )
-            tf = name_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = phase['name']
-            p.font.size = Pt(10)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['dark']
-            p.alignment = PP_ALIGN.CENTER
-            
-            # Phase duration (below)
-            duration_box = slide.shapes.add_textbox(
-                x_pos - Inches(0.5), line_y + Inches(0.3),
-                Inches(1.3), Inches(0.3)
-            )
-            tf = duration_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = phase['duration']
-            p.font.size = Pt(9)
-            p.font.color.rgb = self.colors['gray']
-            p.alignment = PP_ALIGN.CENTER
-            
     def _add_key_initiatives(self, slide, initiatives, x, y, width, height):
         """Add key initiatives in a structured layout"""
         # Create container
@@ -1123,89 +1113,77 @@ class UltraCondensedPPT:
             x, y, width, height
         )
         container.fill.background()
-        container.line.color.rgb = self.colors['gray']
-        container.line.width = Pt(1)
+        container.line.color.rgb = GRAY
+        container.line.width = POINTS[1]
         
         # Add initiatives in a grid
         cols = 3
         rows = (len(initiatives) + cols - 1) // cols
         
-        init_width = width / cols - Inches(0.2)
-        init_height = height / rows - Inches(0.2)
+        init_width = width / cols - INCHES[0.2]
+        init_height = height / rows - INCHES[0.2]
+        colors = self._INITIATIVE_COLORS
+        
+        col_xs = [x + INCHES[0.1] + (init_width + INCHES[0.1]) * col for col in range(cols)]
+        row_ys = [y + INCHES[0.1] + (init_height + INCHES[0.1]) * row for row in range(rows)]
         
+        boxes = []
         for i, initiative in enumerate(initiatives[:6]):  # Max 6 initiatives
-            row = i // cols
-            col = i % cols
-            
-            x_pos = x + Inches(0.1) + (init_width + Inches(0.1)) * col
-            y_pos = y + Inches(0.1) + (init_height + Inches(0.1)) * row
-            
-            # Initiative box
-            init_box = slide.shapes.add_shape(
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                x_pos, y_pos,
-                init_width, init_height
-            )
-            init_box.fill.solid()
-            colors = [self.colors['primary'], self.colors['secondary'], 
-                     self.colors['purple'], self.colors['success'],
-                     self.colors['warning'], self.colors['danger']]
-            init_box.fill.fore_color.rgb = colors[i % len(colors)]
-            init_box.line.fill.background()
-            
-            tf = init_box.text_frame
-            tf.margin_all = Inches(0.15)
-            
-            # Initiative title
-            p = tf.paragraphs[0]
-            p.text = initiative['title']
-            p.font.size = Pt(11)
-            p.font.bold = True
-            p.font.color.rgb = self.colors['white']
-            p.alignment = PP_ALIGN.CENTER
+            x_pos = col_xs[i % cols]
+            y_pos = row_ys[i // cols]
             
-            # Initiative impact
+            # Initiative title, then its impact if given
+            paragraphs = [(initiative['title'], 11, True, WHITE, None, PP_ALIGN.CENTER)]
             if 'impact' in initiative:
-                p = tf.add_paragraph()
-                p.text = initiative['impact']
-                p.font.size = Pt(9)
-                p.font.color.rgb = self.colors['white']
-                p.alignment = PP_ALIGN.CENTER
-                
+                paragraphs.append((initiative['impact'], 9, None, WHITE, None, PP_ALIGN.CENTER))
+            boxes.append((x_pos, y_pos, init_width, init_height, colors[i % len(colors)], paragraphs))
+            
+        self._add_color_boxes(slide, boxes)
+        
     def _add_key_strategies(self, slide, strategies, x, y, width, height):
         """Add key strategies list"""
-        strat_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            x, y, width, height
+        # Like every box in this module the size is fixed by the caller; text is never measured,
+        # PowerPoint wraps it inside the box when the slide is rendered
+        strat_box = self._add_box(
+            slide, MSO_SHAPE.RECTANGLE,
+            x, y, width, height,
+            LIGHT, PRIMARY, POINTS[1]
         )
-        strat_box.fill.solid()
-        strat_box.fill.fore_color.rgb = self.colors['light']
-        strat_box.line.color.rgb = self.colors['primary']
-        strat_box.line.width = Pt(1)
         
         tf = strat_box.text_frame
-        tf.margin_all = Inches(0.3)
+        tf.margin_all = INCHES[0.3]
         
         # Header
         p = tf.paragraphs[0]
         p.text = "KEY STRATEGIES"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = self.colors['primary']
-        p.alignment = PP_ALIGN.CENTER
+        self._style_paragraph(p, POINTS[14], True, PRIMARY, PP_ALIGN.CENTER)
         
         # Strategies
-        for i, strategy in enumerate(strategies[:5], 1):
-            p = tf.add_paragraph()
-            p.text = f"{i}. {strategy}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = self.colors['dark']
-            p.line_spacing = 1.2
+        self._add_bullets(tf, [f"{i}. {strategy}" for i, strategy in enumerate(strategies[:5], 1)], 11, DARK, 1.2)
             
     def save(self, filename):
         """Save the presentation"""
-        self.prs.save(filename)
+        # Hand python-pptx a file with a 1 MiB buffer so the zip writer's many
+        # small writes are coalesced into a few large ones. The deck is written next to
+        # filename and moved into place, so an interrupted save never leaves a truncated file
+        tmp_name = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_name, 'wb', buffering=1 << 20) as f:
+                self.prs.save(f)
+            os.replace(tmp_name, filename)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
         return filename
+        
+    def close(self):
+        """Release the presentation and its caches; build a new instance for the next deck"""
+        self.prs = self.blank_layout = None
+        self._shape_templates.clear()
+        self._nav_bars.clear()
+        self._image_parts.clear()
+        self._img_buf.close()
 
 
 # Example usage functions
@@ -1298,6 +1276,7 @@ def create_3_slide_example():
     ppt.create_3_slide_presentation(case_data)
     filename = "Ultra_Condensed_3_Slide_Presentation.pptx"
     ppt.save(filename)
+    ppt.close()
     print(f"✓ Created 3-slide presentation: {filename}")
     return filename
 
@@ -1404,14 +1383,11 @@ def create_5_slide_example():
     }
     
     # Create the 5-slide presentation
-    ppt._create_title_context_slide(case_data)
-    ppt._create_problem_analysis_slide(case_data)
-    ppt._create_strategic_solution_slide(case_data)
-    ppt._create_implementation_roadmap_slide(case_data)
-    ppt._create_impact_recommendations_slide(case_data)
+    ppt.create_5_slide_presentation(case_data)
     
     filename = "Ultra_Condensed_5_Slide_Presentation.pptx"
     ppt.save(filename)
+    ppt.close()
     print(f"✓ Created 5-slide presentation: {filename}")
     return filename
 